@@ -842,6 +842,18 @@ const NODE_TIMEOUT = 90000; // 90 seconds - consider node offline if no heartbea
  * Receive heartbeat from a node agent
  */
 app.post('/api/nodes/heartbeat', (req, res) => {
+  // Beat-only heartbeat: the node's state is unchanged since its last full heartbeat,
+  // so just refresh its liveness. 409 tells the agent to resend its full state.
+  if (req.query.beat_only) {
+    const node = nodeRegistry.get(req.query.node_id);
+    if (!node) {
+      return res.status(409).json({ error: 'Unknown node, send full heartbeat' });
+    }
+    node.last_heartbeat = new Date().toISOString();
+    node.received_timestamp = req.query.timestamp;
+    return res.json({ status: 'ok', registered: true });
+  }
+
   const {
     node_id,
     hostname,
@@ -851,13 +863,27 @@ app.post('/api/nodes/heartbeat', (req, res) => {
     comfyui,
     workflows,
     system,
-    timestamp
+    timestamp,
+    models_hash,
+    models_unchanged
   } = req.body;
 
   if (!node_id) {
     return res.status(400).json({ error: 'node_id is required' });
   }
 
+  // Agents leave out their model lists when models_hash matches what we stored;
+  // carry the stored lists over, or ask for them again with a 409
+  if (models_unchanged) {
+    const previous = nodeRegistry.get(node_id);
+    if (!previous || previous.models_hash !== models_hash || !ollama || !comfyui) {
+      return res.status(409).json({ error: 'Unknown models_hash, send model lists' });
+    }
+    ollama.models = previous.ollama.models;
+    ollama.all_models = previous.ollama.all_models;
+    comfyui.models_info = previous.comfyui.models_info;
+  }
+
   const nodeData = {
     node_id,
     hostname,
@@ -867,6 +893,7 @@ app.post('/api/nodes/heartbeat', (req, res) => {
     comfyui: comfyui || { available: false },
     workflows: workflows || { supported: [], ready: [] },
     system: system || {},
+    models_hash: models_hash || null,
     last_heartbeat: new Date().toISOString(),
     received_timestamp: timestamp
   };
@@ -875,7 +902,7 @@ app.post('/api/nodes/heartbeat', (req, res) => {
   const workflowCount = workflows?.ready?.length || 0;
   console.log(`💓 Heartbeat from ${hostname} (${node_id.slice(0, 8)}...) - Ollama: ${ollama?.available ? '✅' : '❌'}, ComfyUI: ${comfyui?.available ? '✅' : '❌'}${workflowCount > 0 ? `, Workflows: ${workflowCount}` : ''}`);
 
-  res.json({ status: 'ok', registered: true });
+  res.json({ status: 'ok', registered: true, models_hash: nodeData.models_hash });
 });
 
 /**
@@ -1081,6 +1108,7 @@ app.get('/api/agent/version', (req, res) => {
  * GET /api/agent/check
  * Check if an update is needed by comparing hashes
  * Query params: hash (current agent hash)
+ * Headers: If-None-Match: "<hash>" (answered with 304 when current)
  */
 app.get('/api/agent/check', (req, res) => {
   const clientHash = req.query.hash;
@@ -1090,6 +1118,13 @@ app.get('/api/agent/check', (req, res) => {
     return res.status(500).json({ error: 'Failed to read agent file' });
   }
 
+  // Agents send their hash as If-None-Match; an up-to-date agent gets an empty 304
+  const etag = `"${versionInfo.hash}"`;
+  res.setHeader('ETag', etag);
+  if (req.headers['if-none-match'] === etag) {
+    return res.status(304).end();
+  }
+
   const needsUpdate = clientHash !== versionInfo.hash;
 
   res.json({
@@ -16,33 +16,70 @@ Usage:
 
 Requirements:
     pip install flask requests psutil
+    pip install waitress  (optional, production WSGI server)
+    pip install nvidia-ml-py  (optional, GPU stats via NVML instead of nvidia-smi)
 """
 
 import argparse
+import atexit
+import csv
+import gzip
 import hashlib
+import heapq
+import io
 import json
 import os
 import platform
+import random
+import re
+import reprlib
 import shutil
 import socket
 import subprocess
 import sys
 import threading
 import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, wait
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache, singledispatch
+from itertools import chain, count
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 
 try:
-    from flask import Flask, jsonify, render_template_string, request
+    from flask import Flask, Response, jsonify, render_template, request, stream_with_context
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     import psutil
 except ImportError:
     print("Installing required packages...")
     subprocess.check_call([sys.executable, "-m", "pip", "install", "flask", "requests", "psutil"])
-    from flask import Flask, jsonify, render_template_string, request
+    from flask import Flask, Response, jsonify, render_template, request, stream_with_context
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     import psutil
 
+# Optional: production WSGI server (falls back to Flask's built-in server)
+try:
+    from waitress import serve as waitress_serve
+except ImportError:
+    waitress_serve = None
+
+# Optional: faster JSON encoding for API responses and heartbeat payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: NVML bindings for GPU stats without spawning nvidia-smi
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
 
 # Agent Version - used for update checking
 AGENT_VERSION = "1.1.0"
@@ -53,7 +90,12 @@ DEFAULT_OLLAMA_PORT = 11434
 DEFAULT_COMFYUI_PORT = 8000
 HEARTBEAT_INTERVAL = 30  # seconds
 MAX_LOG_ENTRIES = 200  # Maximum log entries to keep
+FULL_PAYLOAD_LOG_ENTRIES = 20  # Newest entries per service that keep full request/response payloads
 STATS_HISTORY_SIZE = 100  # Number of request stats to keep for averaging
+# Proxied POST/PUT requests in flight per service (matches the frontend's queue concurrency)
+MAX_OLLAMA_SUBMISSIONS = 8  # --max-ollama-submissions
+MAX_COMFYUI_SUBMISSIONS = 6  # --max-comfyui-submissions
+SUBMISSION_WAIT_TIMEOUT = 30  # seconds a submission waits for a free slot before a 503
 COMFYUI_MODELS_PATHS = {
     "unet": ["models/unet", "models/diffusion_models", "models/checkpoints"],
     "vae": ["models/vae"],
@@ -61,6 +103,34 @@ COMFYUI_MODELS_PATHS = {
     "lora": ["models/loras"]
 }
 
+# Shared HTTP session for all outbound traffic (service probes, proxied
+# requests, heartbeats) and the worker pool the periodic probes fan out on.
+# pool_maxsize covers the proxy's concurrent requests to one local service.
+SESSION = requests.Session()
+_session_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+SESSION.mount("http://", _session_adapter)
+SESSION.mount("https://", _session_adapter)
+# Separate pooled session for update checks/downloads against the server, with
+# retries so a dropped keep-alive connection doesn't fail the whole poll
+UPDATE_SESSION = requests.Session()
+_update_adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+UPDATE_SESSION.mount("https://", _update_adapter)
+UPDATE_SESSION.mount("http://", _update_adapter)
+atexit.register(SESSION.close)
+atexit.register(UPDATE_SESSION.close)
+probe_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="probe")
+# The ComfyUI endpoint walk runs inside a probe_executor task, so its fan-out gets
+# its own pool; sharing one pool lets blocked parents starve their own children
+comfyui_probe_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="comfyui-probe")
+
+# Handle on the agent's own process; cpu_percent(interval=None) reports usage
+# since the previous call, so prime the counters once here
+_proc = psutil.Process()
+psutil.cpu_percent(interval=None)
+psutil.cpu_percent(interval=None, percpu=True)
+_proc.cpu_percent(interval=None)
+
 # Config file path (same directory as agent.py)
 CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'agent_config.json')
 
@@ -70,6 +140,12 @@ model_config = {
     "comfyui_disabled_workflows": []  # List of workflow IDs to hide
 }
 
+# Config writes are debounced: toggles mark the config dirty and the writer
+# thread saves at most once per CONFIG_SAVE_DEBOUNCE seconds
+CONFIG_SAVE_DEBOUNCE = 1.0  # seconds
+config_dirty = threading.Event()
+config_lock = threading.Lock()
+
 
 def load_config():
     """Load agent configuration from file"""
@@ -87,7 +163,7 @@ def load_config():
 def save_config():
     """Save agent configuration to file"""
     try:
-        with open(CONFIG_FILE, 'w') as f:
+        with config_lock, open(CONFIG_FILE, 'w') as f:
             json.dump(model_config, f, indent=2)
         print(f"[Config] Saved configuration to {CONFIG_FILE}")
         return True
@@ -99,7 +175,7 @@ def save_config():
 def get_enabled_ollama_models():
     """Get list of Ollama models that are enabled for broadcast"""
     all_models = node_state['ollama'].get('models', [])
-    disabled = model_config.get('ollama_disabled_models', [])
+    disabled = set(model_config.get('ollama_disabled_models', []))
     return [m for m in all_models if m not in disabled]
 
 
@@ -110,15 +186,37 @@ def is_ollama_model_enabled(model_name: str) -> bool:
 
 def set_ollama_model_enabled(model_name: str, enabled: bool):
     """Enable or disable an Ollama model for broadcast"""
-    disabled = model_config.get('ollama_disabled_models', [])
+    with config_lock:
+        disabled = model_config.get('ollama_disabled_models', [])
+
+        if enabled and model_name in disabled:
+            disabled.remove(model_name)
+        elif not enabled and model_name not in disabled:
+            disabled.append(model_name)
+
+        model_config['ollama_disabled_models'] = disabled
+    schedule_config_save()
+
+
+def schedule_config_save():
+    """Mark the config dirty; config_writer persists it after a short debounce"""
+    config_dirty.set()
+
+
+def config_writer():
+    """Background thread that coalesces bursts of config changes into one write"""
+    while True:
+        config_dirty.wait()
+        time.sleep(CONFIG_SAVE_DEBOUNCE)
+        config_dirty.clear()
+        save_config()
 
-    if enabled and model_name in disabled:
-        disabled.remove(model_name)
-    elif not enabled and model_name not in disabled:
-        disabled.append(model_name)
 
-    model_config['ollama_disabled_models'] = disabled
-    save_config()
+def flush_config():
+    """Write any pending config change immediately (at exit / before restart)"""
+    if config_dirty.is_set():
+        config_dirty.clear()
+        save_config()
 
 
 # Real-time statistics for load balancing
@@ -134,8 +232,9 @@ agent_stats = {
         "requests_per_minute": 0,
         "success_rate": 100.0,
         "current_queue_depth": 0,
-        "recent_response_times": [],  # Last N response times for rolling avg
-        "requests_last_minute": [],  # Timestamps for rate calculation
+        "recent_response_times": deque(maxlen=STATS_HISTORY_SIZE),  # Last N response times for rolling avg
+        "recent_response_sum_ms": 0,  # Running sum of recent_response_times
+        "requests_last_minute": deque(),  # time.monotonic() stamps for rate calculation, oldest first
         "last_error": None,
         "last_error_time": None,
         "tokens_generated": 0,
@@ -152,35 +251,53 @@ agent_stats = {
         "requests_per_minute": 0,
         "success_rate": 100.0,
         "current_queue_depth": 0,
-        "recent_response_times": [],
-        "requests_last_minute": [],
+        "recent_response_times": deque(maxlen=STATS_HISTORY_SIZE),
+        "recent_response_sum_ms": 0,
+        "requests_last_minute": deque(),
         "last_error": None,
         "last_error_time": None,
         "renders_completed": 0,
         "avg_render_time_ms": 0
     },
     "uptime_seconds": 0,
-    "started_at": None
+    "started_at": None,
+    "started_monotonic": None  # time.monotonic() at startup, for uptime math
 }
+# Proxy handlers update stats concurrently; the running sum and the deques are
+# read-modify-written, so updates, pruning and resets happen under this lock
+stats_lock = threading.Lock()
 
 
 # ============================================
 # AUTO-UPDATE SYSTEM
 # ============================================
 
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB: agent.py hashes in a single read/update
+
+
 def get_file_hash(filepath: str) -> Optional[str]:
-    """Calculate MD5 hash of a file"""
+    """Calculate MD5 hash of a file (memoized until its mtime or size changes)"""
     try:
-        hash_md5 = hashlib.md5()
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+        st = os.stat(filepath)
+        return _file_hash(filepath, st.st_mtime_ns, st.st_size)
     except Exception as e:
         print(f"[!] Failed to calculate file hash: {e}")
         return None
 
 
+@lru_cache(maxsize=8)
+def _file_hash(filepath: str, mtime_ns: int, size: int) -> str:
+    """Hash a file; mtime_ns/size are only the cache key"""
+    # MD5 stays: the server and every deployed agent compare MD5 hex digests
+    with open(filepath, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: chunk loop runs in C
+            return hashlib.file_digest(f, "md5").hexdigest()
+        hash_md5 = hashlib.md5()
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            hash_md5.update(chunk)
+    return hash_md5.hexdigest()
+
+
 def check_for_updates(server_url: str) -> Dict:
     """Check if an update is available from the server"""
     try:
@@ -188,12 +305,17 @@ def check_for_updates(server_url: str) -> Dict:
         if not current_hash:
             return {"needsUpdate": False, "error": "Failed to get current file hash"}
 
-        response = requests.get(
+        # The server answers 304 with no body when our hash is still current;
+        # the hash param stays for servers that don't honour If-None-Match
+        response = UPDATE_SESSION.get(
             f"{server_url}/api/agent/check",
             params={"hash": current_hash},
+            headers={"If-None-Match": f'"{current_hash}"'},
             timeout=10
         )
 
+        if response.status_code == 304:
+            return {"needsUpdate": False, "currentHash": current_hash, "clientHash": current_hash}
         if response.ok:
             return response.json()
         else:
@@ -202,28 +324,33 @@ def check_for_updates(server_url: str) -> Dict:
         return {"needsUpdate": False, "error": str(e)}
 
 
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
 def download_update(server_url: str) -> Optional[str]:
     """Download the latest agent.py to a temp file"""
     try:
-        response = requests.get(
+        with UPDATE_SESSION.get(
             f"{server_url}/api/agent/download",
             timeout=30,
             stream=True
-        )
-
-        if not response.ok:
-            print(f"[!] Failed to download update: {response.status_code}")
-            return None
-
-        # Save to temp file
-        temp_path = __file__ + ".new"
-        with open(temp_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        ) as response:
+            if not response.ok:
+                print(f"[!] Failed to download update: {response.status_code}")
+                return None
+
+            # Save to temp file, hashing chunks as they arrive so verification
+            # doesn't have to read the file back
+            temp_path = __file__ + ".new"
+            hash_md5 = hashlib.md5()
+            with open(temp_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    hash_md5.update(chunk)
+            server_hash = response.headers.get("X-Agent-Hash")
 
         # Verify the download
-        new_hash = get_file_hash(temp_path)
-        server_hash = response.headers.get("X-Agent-Hash")
+        new_hash = hash_md5.hexdigest()
 
         if server_hash and new_hash != server_hash:
             print(f"[!] Download verification failed: hash mismatch")
@@ -242,12 +369,17 @@ def apply_update(temp_path: str) -> bool:
         current_path = __file__
         backup_path = current_path + ".backup"
 
-        # Create backup
-        shutil.copy2(current_path, backup_path)
+        # Create backup: a hard link costs only metadata; copy where links aren't supported
+        if os.path.exists(backup_path):
+            os.remove(backup_path)
+        try:
+            os.link(current_path, backup_path)
+        except OSError:
+            shutil.copy2(current_path, backup_path)
         print(f"[Update] Created backup at {backup_path}")
 
-        # Replace current file
-        shutil.move(temp_path, current_path)
+        # Replace current file atomically (the backup keeps the old inode)
+        os.replace(temp_path, current_path)
         print(f"[Update] Applied update successfully")
 
         return True
@@ -257,7 +389,7 @@ def apply_update(temp_path: str) -> bool:
         # Try to restore backup
         try:
             if os.path.exists(backup_path):
-                shutil.move(backup_path, current_path)
+                os.replace(backup_path, current_path)
                 print("[Update] Restored from backup")
         except:
             pass
@@ -309,6 +441,9 @@ def perform_auto_update(server_url: str) -> bool:
 def restart_agent():
     """Restart the agent process"""
     print("[Restart] Restarting agent...")
+    flush_config()  # os.execl skips atexit handlers
+    gpu_sampler_stop.set()
+    nvml_shutdown()
     time.sleep(1)
 
     # Re-execute the current script with the same arguments
@@ -318,6 +453,44 @@ def restart_agent():
 
 app = Flask(__name__)
 
+
+def json_default(obj):
+    """Serialize the container types node_state uses that JSON has no type for"""
+    if isinstance(obj, (deque, set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson:
+    try:
+        from flask.json.provider import DefaultJSONProvider
+    except ImportError:  # Flask < 2.2 has no pluggable JSON provider
+        DefaultJSONProvider = None
+
+    if DefaultJSONProvider:
+        class OrjsonProvider(DefaultJSONProvider):
+            """Flask JSON provider backed by orjson"""
+
+            @staticmethod
+            def _orjson_default(obj):
+                try:
+                    return json_default(obj)
+                except TypeError:
+                    return DefaultJSONProvider.default(obj)
+
+            def dumps(self, obj, **kwargs):
+                # Datetimes go through Flask's default so responses keep their existing format
+                return orjson.dumps(
+                    obj,
+                    default=self._orjson_default,
+                    option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                ).decode()
+
+            def loads(self, s, **kwargs):
+                return orjson.loads(s)
+
+        app.json = OrjsonProvider(app)
+
 # CORS support for browser requests
 @app.after_request
 def add_cors_headers(response):
@@ -329,8 +502,33 @@ def add_cors_headers(response):
 
 # Communication logs for Ollama and ComfyUI
 communication_logs = {
-    "ollama": [],
-    "comfyui": []
+    "ollama": deque(maxlen=MAX_LOG_ENTRIES),  # Newest first
+    "comfyui": deque(maxlen=MAX_LOG_ENTRIES)
+}
+# Guards the log deques: appendleft plus aging an entry is one update, and
+# iterating a deque while another thread appends raises RuntimeError
+logs_lock = threading.Lock()
+
+
+def newest_log_id(service: str) -> Optional[str]:
+    """Id of a service's most recent log entry (None while the log is empty)"""
+    with logs_lock:
+        logs = communication_logs[service]
+        return logs[0]["id"] if logs else None
+
+
+def snapshot_logs(service: str) -> list:
+    """Copy of a service's log entries, newest first"""
+    with logs_lock:
+        return list(communication_logs[service])
+
+
+# Admission control for proxied submissions, per service: bounds how many requests
+# (and their payloads) are queued on the local Ollama/ComfyUI at once. A slot is
+# held until the upstream response has been relayed, streams included.
+submission_slots = {
+    "ollama": threading.BoundedSemaphore(MAX_OLLAMA_SUBMISSIONS),
+    "comfyui": threading.BoundedSemaphore(MAX_COMFYUI_SUBMISSIONS)
 }
 
 # Workflow registry - defines supported workflows with their configurations
@@ -462,31 +660,98 @@ WORKFLOW_REGISTRY = {
 }
 
 
+@lru_cache(maxsize=None)
+def workflow_template(workflow_id: str) -> bytes:
+    """Compact workflow JSON with its {{PLACEHOLDER}}s intact, serialized once"""
+    return encode_json(WORKFLOW_REGISTRY[workflow_id]["workflow_json"])
+
+
+@lru_cache(maxsize=None)
+def workflow_download(workflow_id: str) -> bytes:
+    """Pretty-printed workflow JSON for the download endpoint, serialized once"""
+    return json.dumps(WORKFLOW_REGISTRY[workflow_id]["workflow_json"], indent=2).encode('utf-8')
+
+
+# The seed placeholder is matched with its quotes so it becomes a bare int
+WORKFLOW_PLACEHOLDER_RE = re.compile(rb'(\{\{POSITIVE_PROMPT\}\}|\{\{NEGATIVE_PROMPT\}\}|"\{\{SEED\}\}")')
+
+
+@lru_cache(maxsize=None)
+def workflow_cuts(workflow_id: str) -> Tuple[bytes, ...]:
+    """Template bytes cut at each placeholder, computed once per workflow
+
+    Even indexes are literal segments, odd indexes the placeholder that goes
+    between them (repeated placeholders appear once per occurrence).
+    """
+    return tuple(WORKFLOW_PLACEHOLDER_RE.split(workflow_template(workflow_id)))
+
+
+def render_workflow(workflow_id: str, positive_prompt: str, negative_prompt: str, seed: int) -> bytes:
+    """Fill a workflow's placeholders with one join over its precomputed cuts"""
+    # Prompts are JSON-escaped (minus the surrounding quotes) since they land inside
+    # existing string literals
+    values = {
+        b"{{POSITIVE_PROMPT}}": encode_json(positive_prompt)[1:-1],
+        b"{{NEGATIVE_PROMPT}}": encode_json(negative_prompt)[1:-1],
+        b'"{{SEED}}"': str(seed).encode('ascii'),
+    }
+    cuts = workflow_cuts(workflow_id)
+    parts = list(cuts)
+    parts[1::2] = [values[token] for token in cuts[1::2]]
+    return b"".join(parts)
+
+
+# Bounded repr for log summaries: large payloads are truncated while being
+# formatted instead of being fully stringified and then sliced
+_summary_repr = reprlib.Repr()
+_summary_repr.maxlevel = 3
+_summary_repr.maxdict = 20
+_summary_repr.maxlist = 20
+_summary_repr.maxstring = 500
+_summary_repr.maxother = 500
+
+
+@singledispatch
+def summarize(obj, max_len=500):
+    """Summarize logged data for display"""
+    if obj is None:
+        return None
+    return _summary_repr.repr(obj)[:max_len]
+
+
+@summarize.register(str)
+def _summarize_str(obj, max_len=500):
+    return obj[:max_len] + "..." if len(obj) > max_len else obj
+
+
+@summarize.register(dict)
+def _summarize_dict(obj, max_len=500):
+    # For workflow submissions, show key info
+    if 'prompt' in obj:
+        return f"[Workflow with {len(obj.get('prompt', {}))} nodes]"
+    # For Ollama, show model and prompt preview
+    if 'model' in obj:
+        prompt = obj.get('prompt', obj.get('messages', [{}])[0].get('content', ''))[:100]
+        return f"model={obj['model']}, prompt={prompt}..."
+    return _summary_repr.repr(obj)[:max_len]
+
+
+@summarize.register(list)
+def _summarize_list(obj, max_len=500):
+    return f"[List with {len(obj)} items]"
+
+
+# Log entry ids: a process-wide counter is unique even for same-microsecond entries
+_log_ids = count(1)
+
+
 def add_log_entry(service: str, direction: str, endpoint: str, data: any, response: any = None, error: str = None, duration_ms: float = None, status_code: int = None):
     """Add a log entry for Ollama or ComfyUI communication"""
 
-    # Summarize data intelligently
-    def summarize(obj, max_len=500):
-        if obj is None:
-            return None
-        if isinstance(obj, str):
-            return obj[:max_len] + "..." if len(obj) > max_len else obj
-        if isinstance(obj, dict):
-            # For workflow submissions, show key info
-            if 'prompt' in obj:
-                return f"[Workflow with {len(obj.get('prompt', {}))} nodes]"
-            # For Ollama, show model and prompt preview
-            if 'model' in obj:
-                prompt = obj.get('prompt', obj.get('messages', [{}])[0].get('content', ''))[:100]
-                return f"model={obj['model']}, prompt={prompt}..."
-            return str(obj)[:max_len]
-        if isinstance(obj, list):
-            return f"[List with {len(obj)} items]"
-        return str(obj)[:max_len]
-
+    now = datetime.now()
     entry = {
-        "id": f"{service}_{datetime.now().strftime('%H%M%S%f')}",
-        "timestamp": datetime.now().isoformat(),
+        "id": f"{service}_{next(_log_ids)}",
+        "timestamp": now.isoformat(),
         "direction": direction,  # "send" or "receive"
         "endpoint": endpoint,
         "method": "POST" if direction == "send" else "RESPONSE",
@@ -499,93 +764,172 @@ def add_log_entry(service: str, direction: str, endpoint: str, data: any, respon
         "full_response": response
     }
 
-    if service in communication_logs:
-        communication_logs[service].insert(0, entry)
-        # Keep only the last MAX_LOG_ENTRIES
-        communication_logs[service] = communication_logs[service][:MAX_LOG_ENTRIES]
+    if service not in communication_logs:
+        return
+    with logs_lock:
+        logs = communication_logs[service]
+        # The deque drops the oldest entry once MAX_LOG_ENTRIES is reached
+        logs.appendleft(entry)
+        # Older entries keep only their summaries; full payloads (workflow JSON can be
+        # hundreds of KB) are released once they fall out of the newest window
+        if len(logs) > FULL_PAYLOAD_LOG_ENTRIES:
+            aged = logs[FULL_PAYLOAD_LOG_ENTRIES]
+            aged["full_data"] = None
+            aged["full_response"] = None
+
+
+def elapsed_ms(start_ns: int) -> float:
+    """Milliseconds since a time.monotonic_ns() start token"""
+    return (time.monotonic_ns() - start_ns) / 1_000_000
 
 
 def log_ollama_request(endpoint: str, data: dict):
-    """Log an outgoing Ollama request"""
+    """Log an outgoing Ollama request, returning a time.monotonic_ns() start token"""
     add_log_entry("ollama", "send", endpoint, data)
-    return datetime.now()
+    return time.monotonic_ns()
 
 
-def log_ollama_response(endpoint: str, start_time: datetime, response: any = None, error: str = None, status_code: int = None):
+def log_ollama_response(endpoint: str, start_time: int, response: any = None, error: str = None, status_code: int = None):
     """Log an Ollama response"""
-    duration_ms = (datetime.now() - start_time).total_seconds() * 1000
+    duration_ms = elapsed_ms(start_time)
     add_log_entry("ollama", "receive", endpoint, None, response, error, duration_ms, status_code)
 
 
 def log_comfyui_request(endpoint: str, data: dict):
-    """Log an outgoing ComfyUI request"""
+    """Log an outgoing ComfyUI request, returning a time.monotonic_ns() start token"""
     add_log_entry("comfyui", "send", endpoint, data)
-    return datetime.now()
+    return time.monotonic_ns()
 
 
-def log_comfyui_response(endpoint: str, start_time: datetime, response: any = None, error: str = None, status_code: int = None):
+def log_comfyui_response(endpoint: str, start_time: int, response: any = None, error: str = None, status_code: int = None):
     """Log a ComfyUI response"""
-    duration_ms = (datetime.now() - start_time).total_seconds() * 1000
+    duration_ms = elapsed_ms(start_time)
     add_log_entry("comfyui", "receive", endpoint, None, response, error, duration_ms, status_code)
 
 
 def update_stats(service: str, duration_ms: float, success: bool, error: str = None, tokens: int = 0):
     """Update real-time statistics for a service"""
-    stats = agent_stats[service]
-    now = datetime.now()
+    with stats_lock:
+        stats = agent_stats[service]
+        now = datetime.now()
+
+        # Update request counts
+        stats["total_requests"] += 1
+        if success:
+            stats["successful_requests"] += 1
+        else:
+            stats["failed_requests"] += 1
+            stats["last_error"] = error
+            stats["last_error_time"] = now.isoformat()
+
+        # Update response times
+        stats["total_response_time_ms"] += duration_ms
+
+        # Rolling average over the last N response times (the deque drops the oldest itself)
+        recent = stats["recent_response_times"]
+        if len(recent) == recent.maxlen:
+            stats["recent_response_sum_ms"] -= recent[0]
+        recent.append(duration_ms)
+        stats["recent_response_sum_ms"] += duration_ms
+        stats["avg_response_time_ms"] = stats["recent_response_sum_ms"] / len(recent)
+
+        # Update min/max
+        if stats["min_response_time_ms"] is None or duration_ms < stats["min_response_time_ms"]:
+            stats["min_response_time_ms"] = duration_ms
+        if stats["max_response_time_ms"] is None or duration_ms > stats["max_response_time_ms"]:
+            stats["max_response_time_ms"] = duration_ms
+
+        # Update success rate
+        if stats["total_requests"] > 0:
+            stats["success_rate"] = (stats["successful_requests"] / stats["total_requests"]) * 100
+
+        # Track requests per minute
+        mono_now = time.monotonic()
+        stats["requests_last_minute"].append(mono_now)
+        prune_requests_last_minute(stats, mono_now)
+
+        # Track tokens for Ollama
+        if service == "ollama" and tokens > 0:
+            stats["tokens_generated"] += tokens
+            if duration_ms > 0:
+                tokens_per_sec = (tokens / duration_ms) * 1000
+                # Running average
+                if stats["tokens_per_second_avg"] == 0:
+                    stats["tokens_per_second_avg"] = tokens_per_sec
+                else:
+                    stats["tokens_per_second_avg"] = (stats["tokens_per_second_avg"] + tokens_per_sec) / 2
+
+
+def prune_requests_last_minute(stats: Dict, now: float):
+    """Drop request timestamps (time.monotonic()) older than 1 minute and refresh requests_per_minute
+
+    Call with stats_lock held.
+    """
+    timestamps = stats["requests_last_minute"]
+    one_minute_ago = now - 60
+    while timestamps and timestamps[0] <= one_minute_ago:
+        timestamps.popleft()
+    stats["requests_per_minute"] = len(timestamps)
+
+
+CPUINFO_READ_BYTES = 8192  # covers the first processor block of /proc/cpuinfo
+
+
+@lru_cache(maxsize=1)
+def get_static_cpu_info() -> Dict:
+    """CPU fields that never change while the agent runs (computed once)"""
+    cpu = {
+        "physical_cores": psutil.cpu_count(logical=False),
+        "logical_cores": psutil.cpu_count(logical=True),
+        "max_freq_mhz": None
+    }
+
+    # Max frequency (may not be available on all systems)
+    try:
+        freq = psutil.cpu_freq()
+        if freq and freq.max:
+            cpu["max_freq_mhz"] = round(freq.max, 0)
+    except:
+        pass
+
+    # Try to get CPU model name
+    try:
+        if platform.system() == "Windows":
+            import winreg
+            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DESCRIPTION\System\CentralProcessor\0")
+            cpu["model"] = winreg.QueryValueEx(key, "ProcessorNameString")[0].strip()
+            winreg.CloseKey(key)
+        elif platform.system() == "Linux":
+            # "model name" sits near the top of the first processor block; one
+            # bounded read avoids walking the per-core blocks line by line
+            with open("/proc/cpuinfo", "rb") as f:
+                buf = f.read(CPUINFO_READ_BYTES)
+            i = buf.find(b"model name")
+            if i != -1:
+                j = buf.find(b":", i)
+                k = buf.find(b"\n", j)
+                cpu["model"] = buf[j + 1:k].decode("utf-8", "replace").strip()
+        elif platform.system() == "Darwin":
+            result = subprocess.run(["sysctl", "-n", "machdep.cpu.brand_string"],
+                                    capture_output=True, text=True)
+            if result.returncode == 0:
+                cpu["model"] = result.stdout.strip()
+    except:
+        cpu["model"] = "Unknown"
+
+    return cpu
 
-    # Update request counts
-    stats["total_requests"] += 1
-    if success:
-        stats["successful_requests"] += 1
-    else:
-        stats["failed_requests"] += 1
-        stats["last_error"] = error
-        stats["last_error_time"] = now.isoformat()
-
-    # Update response times
-    stats["total_response_time_ms"] += duration_ms
-    stats["recent_response_times"].append(duration_ms)
-
-    # Keep only the last N response times for rolling average
-    if len(stats["recent_response_times"]) > STATS_HISTORY_SIZE:
-        stats["recent_response_times"] = stats["recent_response_times"][-STATS_HISTORY_SIZE:]
-
-    # Calculate rolling average
-    if stats["recent_response_times"]:
-        stats["avg_response_time_ms"] = sum(stats["recent_response_times"]) / len(stats["recent_response_times"])
-
-    # Update min/max
-    if stats["min_response_time_ms"] is None or duration_ms < stats["min_response_time_ms"]:
-        stats["min_response_time_ms"] = duration_ms
-    if stats["max_response_time_ms"] is None or duration_ms > stats["max_response_time_ms"]:
-        stats["max_response_time_ms"] = duration_ms
-
-    # Update success rate
-    if stats["total_requests"] > 0:
-        stats["success_rate"] = (stats["successful_requests"] / stats["total_requests"]) * 100
-
-    # Track requests per minute
-    stats["requests_last_minute"].append(now)
-    # Remove requests older than 1 minute
-    one_minute_ago = now.timestamp() - 60
-    stats["requests_last_minute"] = [t for t in stats["requests_last_minute"] if t.timestamp() > one_minute_ago]
-    stats["requests_per_minute"] = len(stats["requests_last_minute"])
-
-    # Track tokens for Ollama
-    if service == "ollama" and tokens > 0:
-        stats["tokens_generated"] += tokens
-        if duration_ms > 0:
-            tokens_per_sec = (tokens / duration_ms) * 1000
-            # Running average
-            if stats["tokens_per_second_avg"] == 0:
-                stats["tokens_per_second_avg"] = tokens_per_sec
-            else:
-                stats["tokens_per_second_avg"] = (stats["tokens_per_second_avg"] + tokens_per_sec) / 2
 
+HOT_CORES_COUNT = 4  # busiest cores reported in the CPU summary
 
-def get_hardware_info() -> Dict:
-    """Get detailed hardware information about CPU, RAM, and GPU"""
+
+def get_hardware_info(per_core: bool = False) -> Dict:
+    """Get detailed hardware information about CPU, RAM, and GPU
+
+    Per-core usage is summarized (max + busiest cores); the full per-core list,
+    which dominates the payload on many-core hosts, is only included when
+    per_core is set.
+    """
     hardware = {
         "cpu": {},
         "memory": {},
@@ -593,47 +937,28 @@ def get_hardware_info() -> Dict:
         "disk": {}
     }
 
-    # CPU Information
+    # CPU Information (static fields cached, usage is non-blocking since the last call)
     try:
         hardware["cpu"] = {
-            "physical_cores": psutil.cpu_count(logical=False),
-            "logical_cores": psutil.cpu_count(logical=True),
+            **get_static_cpu_info(),
             "current_freq_mhz": None,
-            "max_freq_mhz": None,
-            "usage_percent": psutil.cpu_percent(interval=0.1),
-            "per_core_usage": psutil.cpu_percent(interval=0.1, percpu=True)
+            "usage_percent": psutil.cpu_percent(interval=None)
         }
+        core_usage = psutil.cpu_percent(interval=None, percpu=True)
+        if core_usage:
+            hardware["cpu"]["per_core_max"] = max(core_usage)
+            hardware["cpu"]["hot_cores"] = heapq.nlargest(HOT_CORES_COUNT, range(len(core_usage)), key=core_usage.__getitem__)
+        if per_core:
+            hardware["cpu"]["per_core_usage"] = core_usage
 
         # CPU frequency (may not be available on all systems)
         try:
             freq = psutil.cpu_freq()
             if freq:
                 hardware["cpu"]["current_freq_mhz"] = round(freq.current, 0)
-                hardware["cpu"]["max_freq_mhz"] = round(freq.max, 0) if freq.max else None
         except:
             pass
 
-        # Try to get CPU model name
-        try:
-            if platform.system() == "Windows":
-                import winreg
-                key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DESCRIPTION\System\CentralProcessor\0")
-                hardware["cpu"]["model"] = winreg.QueryValueEx(key, "ProcessorNameString")[0].strip()
-                winreg.CloseKey(key)
-            elif platform.system() == "Linux":
-                with open("/proc/cpuinfo", "r") as f:
-                    for line in f:
-                        if "model name" in line:
-                            hardware["cpu"]["model"] = line.split(":")[1].strip()
-                            break
-            elif platform.system() == "Darwin":
-                result = subprocess.run(["sysctl", "-n", "machdep.cpu.brand_string"],
-                                        capture_output=True, text=True)
-                if result.returncode == 0:
-                    hardware["cpu"]["model"] = result.stdout.strip()
-        except:
-            hardware["cpu"]["model"] = "Unknown"
-
     except Exception as e:
         hardware["cpu"]["error"] = str(e)
 
@@ -661,42 +986,13 @@ def get_hardware_info() -> Dict:
     except Exception as e:
         hardware["memory"]["error"] = str(e)
 
-    # GPU Information (NVIDIA via nvidia-smi)
-    try:
-        result = subprocess.run(
-            ['nvidia-smi', '--query-gpu=index,name,driver_version,memory.total,memory.used,memory.free,utilization.gpu,utilization.memory,temperature.gpu,power.draw,power.limit,pstate',
-             '--format=csv,noheader,nounits'],
-            capture_output=True, text=True, timeout=10
-        )
-        if result.returncode == 0:
-            for line in result.stdout.strip().split('\n'):
-                parts = [p.strip() for p in line.split(',')]
-                if len(parts) >= 12:
-                    gpu_info = {
-                        "index": int(parts[0]),
-                        "name": parts[1],
-                        "driver_version": parts[2],
-                        "memory_total_mb": int(parts[3]),
-                        "memory_used_mb": int(parts[4]),
-                        "memory_free_mb": int(parts[5]),
-                        "utilization_gpu_percent": int(parts[6]) if parts[6] != '[N/A]' else None,
-                        "utilization_memory_percent": int(parts[7]) if parts[7] != '[N/A]' else None,
-                        "temperature_c": int(parts[8]) if parts[8] != '[N/A]' else None,
-                        "power_draw_w": float(parts[9]) if parts[9] not in ['[N/A]', '[Not Supported]'] else None,
-                        "power_limit_w": float(parts[10]) if parts[10] not in ['[N/A]', '[Not Supported]'] else None,
-                        "performance_state": parts[11]
-                    }
-                    # Calculate memory usage percentage
-                    if gpu_info["memory_total_mb"] > 0:
-                        gpu_info["memory_usage_percent"] = round(
-                            (gpu_info["memory_used_mb"] / gpu_info["memory_total_mb"]) * 100, 1
-                        )
-                    hardware["gpu"].append(gpu_info)
-    except FileNotFoundError:
-        hardware["gpu"] = []
-        hardware["gpu_note"] = "nvidia-smi not found"
-    except Exception as e:
-        hardware["gpu_error"] = str(e)
+    # GPU Information (latest sample from the GPU sampler thread)
+    sample = current_gpu_sample()
+    hardware["gpu"] = sample["gpus"]
+    if sample["note"]:
+        hardware["gpu_note"] = sample["note"]
+    if sample["error"]:
+        hardware["gpu_error"] = sample["error"]
 
     # Disk Information (for the root/main drive)
     try:
@@ -734,6 +1030,8 @@ node_state = {
         "available": False,
         "port": DEFAULT_COMFYUI_PORT,
         "models": [],
+        "models_info": {},
+        "last_good_endpoint": None,  # Probe that last proved ComfyUI alive, tried first next time
         "current_job": None,
         "jobs_completed": 0
     },
@@ -743,24 +1041,52 @@ node_state = {
         "python_version": platform.python_version(),
         "cpu_percent": 0,
         "memory_percent": 0,
-        "gpu_info": None
+        "gpu_info": None,
+        "agent_memory_mb": 0,
+        "agent_threads": 0,
+        "agent_cpu_percent": 0
     },
     "hardware": {},  # Detailed hardware info (populated at startup)
-    "jobs_history": [],  # Last 50 jobs
+    "jobs_history": deque(maxlen=50),  # Last 50 jobs, newest first
     "central_server": None,
     "last_heartbeat": None
 }
 
 
-def get_local_ips() -> List[str]:
-    """Get all local IP addresses"""
-    ips = []
+LOCAL_IPS_TTL = 60  # seconds; addresses only change on DHCP renewals / interface changes
+HOSTNAME_LOOKUP_TIMEOUT = 1  # seconds; gethostbyname can hang for a long time on broken DNS
+_local_ips_cache = {"ts": 0.0, "ips": (), "hostname_ip": None, "lookup": None}
+# A lookup that hangs past its timeout keeps running; it gets its own thread so it
+# never holds a probe worker, and a new lookup isn't queued behind a hung one
+hostname_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hostname")
+
+
+def lookup_hostname_ip() -> Optional[str]:
+    """Resolve this host's name, keeping the previous answer if the resolver is slow"""
+    cache = _local_ips_cache
+    lookup = cache["lookup"]
+    if lookup is None or lookup.done():
+        lookup = cache["lookup"] = hostname_executor.submit(socket.gethostbyname, socket.gethostname())
     try:
-        # Get hostname-based IP
-        hostname = socket.gethostname()
-        ips.append(socket.gethostbyname(hostname))
-    except:
+        cache["hostname_ip"] = lookup.result(timeout=HOSTNAME_LOOKUP_TIMEOUT)
+    except FuturesTimeoutError:
         pass
+    except Exception:
+        cache["hostname_ip"] = None
+    return cache["hostname_ip"]
+
+
+def get_local_ips() -> Tuple[str, ...]:
+    """Get all local IP addresses (cached for LOCAL_IPS_TTL seconds)"""
+    now = time.monotonic()
+    if _local_ips_cache["ips"] and now - _local_ips_cache["ts"] < LOCAL_IPS_TTL:
+        return _local_ips_cache["ips"]
+
+    ips = []
+    # Get hostname-based IP (a slow resolver costs at most HOSTNAME_LOOKUP_TIMEOUT)
+    hostname_ip = lookup_hostname_ip()
+    if hostname_ip:
+        ips.append(hostname_ip)
 
     try:
         # Get all network interfaces
@@ -772,53 +1098,150 @@ def get_local_ips() -> List[str]:
     except:
         pass
 
-    return ips
+    _local_ips_cache["ts"] = now
+    _local_ips_cache["ips"] = tuple(ips)
+    return _local_ips_cache["ips"]
+
+
+# Last /api/tags body hash and the model names parsed from it
+_ollama_tags_cache = {"hash": None, "models": []}
 
 
 def check_ollama() -> Dict:
     """Check if Ollama is running and get models"""
     endpoint = "/api/tags"
     try:
-        start_time = datetime.now()
-        response = requests.get(
+        start_time = time.monotonic_ns()
+        response = SESSION.get(
             f"http://localhost:{node_state['ollama']['port']}{endpoint}",
             timeout=5
         )
         if response.ok:
-            data = response.json()
-            models = [m['name'] for m in data.get('models', [])]
+            # The tag list rarely changes between probes; only re-parse when the body does
+            body_hash = hashlib.blake2s(response.content).digest()
+            if body_hash != _ollama_tags_cache["hash"]:
+                data = response.json()
+                _ollama_tags_cache["models"] = [m['name'] for m in data.get('models', [])]
+                _ollama_tags_cache["hash"] = body_hash
+            models = _ollama_tags_cache["models"]
             # Log successful check
             log_ollama_response(endpoint, start_time, {"models_count": len(models)}, status_code=response.status_code)
             return {"available": True, "models": models}
         log_ollama_response(endpoint, start_time, error=f"HTTP {response.status_code}", status_code=response.status_code)
     except Exception as e:
-        log_ollama_response(endpoint, datetime.now(), error=str(e))
+        log_ollama_response(endpoint, time.monotonic_ns(), error=str(e))
     return {"available": False, "models": []}
 
 
+def probe_comfyui_endpoint(port: int, endpoint: str):
+    """GET a single ComfyUI status endpoint, returning (start_time, response)"""
+    start_time = time.monotonic_ns()
+    return start_time, SESSION.get(f"http://localhost:{port}{endpoint}", timeout=3)
+
+
 def check_comfyui() -> Dict:
     """Check if ComfyUI is running and get object/model info"""
     port = node_state['comfyui']['port']
-    endpoints = ['/system_stats', '/api/system_stats', '/queue', '/api/queue']
 
-    for endpoint in endpoints:
-        try:
-            start_time = datetime.now()
-            response = requests.get(f"http://localhost:{port}{endpoint}", timeout=3)
+    if comfyui_alive(port):
+        # Try to get object_info for model lists
+        models_info = get_comfyui_models(port)
+        return {"available": True, "port": port, "models_info": models_info}
+
+    # A restarted ComfyUI may come back with a different models folder
+    invalidate_comfyui_models()
+    return {"available": False, "port": port, "models_info": {}}
+
+
+COMFYUI_STATUS_ENDPOINTS = ['/system_stats', '/api/system_stats', '/queue', '/api/queue']
+COMFYUI_WALK_TIMEOUT = 5  # seconds for the whole status endpoint walk (each GET times out at 3)
+
+
+def probe_comfyui_root(port: int) -> bool:
+    """HEAD / on ComfyUI; any non-5xx answer (even 404/405) means the process is up"""
+    try:
+        start_time = time.monotonic_ns()
+        response = SESSION.head(f"http://localhost:{port}/", timeout=2, allow_redirects=False)
+        if response.status_code < 500:
+            log_comfyui_response("/", start_time, {"status": "available"}, status_code=response.status_code)
+            return True
+    except requests.RequestException:
+        pass
+    return False
+
+
+def probe_comfyui_status(port: int, endpoint: str) -> bool:
+    """GET one JSON status endpoint, True if it answers OK"""
+    try:
+        start_time, response = probe_comfyui_endpoint(port, endpoint)
+    except requests.RequestException as e:
+        log_comfyui_response(endpoint, time.monotonic_ns(), error=str(e))
+        return False
+    if response.ok:
+        log_comfyui_response(endpoint, start_time, {"status": "available"}, status_code=response.status_code)
+    return response.ok
+
+
+def comfyui_alive(port: int) -> bool:
+    """Liveness check: the last probe that worked, then HEAD /, then the JSON status endpoints"""
+    comfyui = node_state['comfyui']
+    last_good = comfyui.get('last_good_endpoint')
+    if last_good == '/' and probe_comfyui_root(port):
+        return True
+    if last_good in COMFYUI_STATUS_ENDPOINTS and probe_comfyui_status(port, last_good):
+        return True
+
+    if last_good != '/' and probe_comfyui_root(port):
+        comfyui['last_good_endpoint'] = '/'
+        return True
+
+    endpoints = [endpoint for endpoint in COMFYUI_STATUS_ENDPOINTS if endpoint != last_good]
+
+    # Probe the remaining endpoints at once and take the first one that answers OK
+    pending = {comfyui_probe_executor.submit(probe_comfyui_endpoint, port, endpoint): endpoint for endpoint in endpoints}
+    deadline = time.monotonic() + COMFYUI_WALK_TIMEOUT
+    while pending:
+        done, _ = wait(pending, timeout=max(0.0, deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+        if not done:
+            for other in pending:
+                other.cancel()
+            break
+        for future in done:
+            endpoint = pending.pop(future)
+            try:
+                start_time, response = future.result()
+            except Exception as e:
+                log_comfyui_response(endpoint, time.monotonic_ns(), error=str(e))
+                continue
             if response.ok:
                 log_comfyui_response(endpoint, start_time, {"status": "available"}, status_code=response.status_code)
+                for other in pending:
+                    other.cancel()
+                comfyui['last_good_endpoint'] = endpoint
+                return True
 
-                # Try to get object_info for model lists
-                models_info = get_comfyui_models(port)
-                return {"available": True, "port": port, "models_info": models_info}
-        except Exception as e:
-            log_comfyui_response(endpoint, datetime.now(), error=str(e))
+    comfyui['last_good_endpoint'] = None
+    return False
 
-    return {"available": False, "port": port, "models_info": {}}
+
+# /object_info is ComfyUI's largest response (every node definition) while the
+# model lists in it only change when files are added to the models folders
+COMFYUI_MODELS_TTL = 60  # seconds
+_comfyui_models_cache = {"at": 0.0, "port": None, "models": None}
+
+
+def invalidate_comfyui_models():
+    """Drop the cached model lists so the next check refetches /object_info"""
+    _comfyui_models_cache["models"] = None
 
 
 def get_comfyui_models(port: int) -> Dict:
-    """Get available models from ComfyUI object_info endpoint"""
+    """Get available models from ComfyUI object_info endpoint (cached for COMFYUI_MODELS_TTL)"""
+    cached = _comfyui_models_cache
+    if (cached["models"] is not None and cached["port"] == port
+            and time.monotonic() - cached["at"] < COMFYUI_MODELS_TTL):
+        return cached["models"]
+
     models = {
         "checkpoints": [],
         "vae": [],
@@ -828,8 +1251,8 @@ def get_comfyui_models(port: int) -> Dict:
     }
 
     try:
-        start_time = datetime.now()
-        response = requests.get(f"http://localhost:{port}/object_info", timeout=10)
+        start_time = time.monotonic_ns()
+        response = SESSION.get(f"http://localhost:{port}/object_info", timeout=10)
         if response.ok:
             data = response.json()
 
@@ -867,12 +1290,37 @@ def get_comfyui_models(port: int) -> Dict:
                 "unet": len(models["unet"])
             }, status_code=response.status_code)
 
+            cached.update(at=time.monotonic(), port=port, models=models)
+
     except Exception as e:
-        log_comfyui_response("/object_info", datetime.now(), error=str(e))
+        log_comfyui_response("/object_info", time.monotonic_ns(), error=str(e))
 
     return models
 
 
+# Set of every model name in the current models_info; rebuilt only when
+# update_services() publishes a new models_info dict
+_available_models_cache = {"source": None, "models": frozenset()}
+
+
+def available_comfyui_models() -> frozenset:
+    """All model names ComfyUI reported, as a set for O(1) membership tests"""
+    models_info = node_state.get("comfyui", {}).get("models_info", {})
+    cached = _available_models_cache
+    if cached["source"] is not models_info:
+        cached["models"] = frozenset(chain.from_iterable(
+            v for v in models_info.values() if isinstance(v, list)))
+        cached["source"] = models_info
+    return cached["models"]
+
+
+def ready_workflows() -> List[str]:
+    """Workflows whose required models are all available on ComfyUI"""
+    available = available_comfyui_models()
+    return [wf_id for wf_id, wf in WORKFLOW_REGISTRY.items()
+            if available.issuperset(wf.get("models", {}).values())]
+
+
 def check_workflow_model_availability(workflow_id: str) -> Dict:
     """Check if all models required by a workflow are available on ComfyUI"""
     if workflow_id not in WORKFLOW_REGISTRY:
@@ -880,7 +1328,7 @@ def check_workflow_model_availability(workflow_id: str) -> Dict:
 
     workflow = WORKFLOW_REGISTRY[workflow_id]
     required_models = workflow.get("models", {})
-    comfyui_models = node_state.get("comfyui", {}).get("models_info", {})
+    all_available_models = available_comfyui_models()
 
     availability = {
         "workflow_id": workflow_id,
@@ -889,12 +1337,6 @@ def check_workflow_model_availability(workflow_id: str) -> Dict:
         "models": {}
     }
 
-    # Flatten available models for easier checking
-    all_available_models = []
-    for model_list in comfyui_models.values():
-        if isinstance(model_list, list):
-            all_available_models.extend(model_list)
-
     for model_type, model_name in required_models.items():
         is_available = model_name in all_available_models
         availability["models"][model_type] = {
@@ -907,57 +1349,362 @@ def check_workflow_model_availability(workflow_id: str) -> Dict:
     return availability
 
 
+# nvidia-smi is a fork+exec per call and can stall under driver contention, so it
+# runs on its own sampler thread and the heartbeat path only reads the latest result
+GPU_SAMPLE_INTERVAL = 15  # seconds
+gpu_sampler_stop = threading.Event()  # set before NVML is shut down for a restart
+gpu_sample = None  # Latest result of sample_gpu_info(), replaced wholesale on each sample
+
+
 def get_gpu_info() -> Optional[Dict]:
-    """Get GPU information if nvidia-smi is available"""
+    """Get the latest GPU summary (name, memory, utilization per GPU)"""
+    return current_gpu_sample()["info"]
+
+
+def current_gpu_sample() -> Dict:
+    """Latest GPU sample (queries nvidia-smi directly until the sampler has run)"""
+    sample = gpu_sample
+    if sample is None:
+        sample = sample_gpu_info()
+    return sample
+
+
+def sample_gpu_info() -> Dict:
+    """Query the GPUs once and publish the result for both the summary and hardware views"""
+    global gpu_sample
+    sample = {"ts": time.monotonic(), "info": None, "gpus": [], "note": None, "error": None}
     try:
-        result = subprocess.run(
-            ['nvidia-smi', '--query-gpu=name,memory.total,memory.used,memory.free,utilization.gpu',
-             '--format=csv,noheader,nounits'],
-            capture_output=True, text=True, timeout=5
-        )
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            gpus = []
-            for line in lines:
-                parts = [p.strip() for p in line.split(',')]
-                if len(parts) >= 5:
-                    gpus.append({
-                        "name": parts[0],
-                        "memory_total_mb": int(parts[1]),
-                        "memory_used_mb": int(parts[2]),
-                        "memory_free_mb": int(parts[3]),
-                        "utilization_percent": int(parts[4])
-                    })
-            return {"gpus": gpus, "count": len(gpus)}
-    except:
-        pass
-    return None
+        gpus = query_gpu_details()
+        if gpus is not None:
+            sample["gpus"] = gpus
+            sample["info"] = {
+                "gpus": [{
+                    "name": gpu["name"],
+                    "memory_total_mb": gpu["memory_total_mb"],
+                    "memory_used_mb": gpu["memory_used_mb"],
+                    "memory_free_mb": gpu["memory_free_mb"],
+                    "utilization_percent": gpu["utilization_gpu_percent"]
+                } for gpu in gpus],
+                "count": len(gpus)
+            }
+    except FileNotFoundError:
+        sample["note"] = "nvidia-smi not found"
+    except Exception as e:
+        sample["error"] = str(e)
+    gpu_sample = sample
+    return sample
+
+
+def gpu_sampler():
+    """Background thread that keeps the GPU sample fresh until gpu_sampler_stop is set"""
+    while not gpu_sampler_stop.is_set():
+        try:
+            sample_gpu_info()
+        except Exception as e:
+            print(f"GPU sampler error: {e}")
+        gpu_sampler_stop.wait(GPU_SAMPLE_INTERVAL)
+
+
+_nvml_state = {"initialized": None}  # None until the first nvmlInit() attempt
+# Held across init, each NVML query and shutdown, so shutdown never runs mid-query
+_nvml_lock = threading.Lock()
+
+
+def nvml_available() -> bool:
+    """Initialize NVML once (call with _nvml_lock held); False if pynvml is missing,
+    there is no NVIDIA driver, or NVML has been shut down"""
+    if pynvml is None:
+        return False
+    if _nvml_state["initialized"] is None:
+        try:
+            pynvml.nvmlInit()
+            _nvml_state["initialized"] = True
+        except pynvml.NVMLError:
+            _nvml_state["initialized"] = False
+    return _nvml_state["initialized"]
 
 
-def update_system_stats():
-    """Update system statistics"""
-    node_state['system']['cpu_percent'] = psutil.cpu_percent(interval=0.1)
-    node_state['system']['memory_percent'] = psutil.virtual_memory().percent
-    node_state['system']['gpu_info'] = get_gpu_info()
+def nvml_shutdown():
+    """Release the NVML handle taken by nvml_available(); NVML is not re-initialized after this"""
+    with _nvml_lock:
+        initialized = _nvml_state["initialized"]
+        _nvml_state["initialized"] = False
+        if initialized:
+            try:
+                pynvml.nvmlShutdown()
+            except pynvml.NVMLError:
+                pass
 
+
+atexit.register(nvml_shutdown)
+
+
+def nvml_value(fn, *args):
+    """Call an NVML getter, returning None for unsupported fields"""
+    try:
+        return fn(*args)
+    except pynvml.NVMLError:
+        return None
+
+
+def nvml_str(value) -> str:
+    """Older pynvml releases return bytes for names/versions"""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def query_gpu_details() -> Optional[List[Dict]]:
+    """Get detailed per-GPU information via NVML, falling back to nvidia-smi"""
+    with _nvml_lock:
+        if nvml_available():
+            return query_gpu_details_nvml()
+    return query_gpu_details_smi()
+
+
+def query_gpu_details_nvml() -> List[Dict]:
+    """Read per-GPU information through in-process NVML calls"""
+    driver_version = nvml_str(pynvml.nvmlSystemGetDriverVersion())
+    gpus = []
+    for index in range(pynvml.nvmlDeviceGetCount()):
+        handle = pynvml.nvmlDeviceGetHandleByIndex(index)
+        mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+        util = nvml_value(pynvml.nvmlDeviceGetUtilizationRates, handle)
+        power_draw = nvml_value(pynvml.nvmlDeviceGetPowerUsage, handle)
+        power_limit = nvml_value(pynvml.nvmlDeviceGetEnforcedPowerManagementLimit, handle)
+        pstate = nvml_value(pynvml.nvmlDeviceGetPerformanceState, handle)
+
+        # Same shape and units as the nvidia-smi path (MiB, W, "P0"...)
+        gpu_info = {
+            "index": index,
+            "name": nvml_str(pynvml.nvmlDeviceGetName(handle)),
+            "driver_version": driver_version,
+            "memory_total_mb": mem.total // (1024**2),
+            "memory_used_mb": mem.used // (1024**2),
+            "memory_free_mb": mem.free // (1024**2),
+            "utilization_gpu_percent": util.gpu if util else None,
+            "utilization_memory_percent": util.memory if util else None,
+            "temperature_c": nvml_value(pynvml.nvmlDeviceGetTemperature, handle, pynvml.NVML_TEMPERATURE_GPU),
+            "power_draw_w": power_draw / 1000 if power_draw is not None else None,
+            "power_limit_w": power_limit / 1000 if power_limit is not None else None,
+            "performance_state": f"P{pstate}" if pstate is not None else "[N/A]"
+        }
+        if gpu_info["memory_total_mb"] > 0:
+            gpu_info["memory_usage_percent"] = round(
+                (gpu_info["memory_used_mb"] / gpu_info["memory_total_mb"]) * 100, 1
+            )
+        gpus.append(gpu_info)
+    return gpus
+
+
+def query_gpu_details_smi() -> Optional[List[Dict]]:
+    """Query nvidia-smi for detailed per-GPU information (None if it fails)"""
+    result = subprocess.run(
+        ['nvidia-smi', '--query-gpu=index,name,driver_version,memory.total,memory.used,memory.free,utilization.gpu,utilization.memory,temperature.gpu,power.draw,power.limit,pstate',
+         '--format=csv,noheader,nounits'],
+        capture_output=True, text=True, timeout=10
+    )
+    if result.returncode != 0:
+        return None
+
+    # Fields are ", "-separated; skipinitialspace drops the padding while parsing
+    gpus = []
+    for parts in csv.reader(io.StringIO(result.stdout), skipinitialspace=True):
+        if len(parts) >= 12:
+            gpu_info = {
+                "index": int(parts[0]),
+                "name": parts[1],
+                "driver_version": parts[2],
+                "memory_total_mb": int(parts[3]),
+                "memory_used_mb": int(parts[4]),
+                "memory_free_mb": int(parts[5]),
+                "utilization_gpu_percent": int(parts[6]) if parts[6] != '[N/A]' else None,
+                "utilization_memory_percent": int(parts[7]) if parts[7] != '[N/A]' else None,
+                "temperature_c": int(parts[8]) if parts[8] != '[N/A]' else None,
+                "power_draw_w": float(parts[9]) if parts[9] not in ['[N/A]', '[Not Supported]'] else None,
+                "power_limit_w": float(parts[10]) if parts[10] not in ['[N/A]', '[Not Supported]'] else None,
+                "performance_state": parts[11]
+            }
+            # Calculate memory usage percentage
+            if gpu_info["memory_total_mb"] > 0:
+                gpu_info["memory_usage_percent"] = round(
+                    (gpu_info["memory_used_mb"] / gpu_info["memory_total_mb"]) * 100, 1
+                )
+            gpus.append(gpu_info)
+    return gpus
+
+
+def update_system_stats(memory=None, gpu_info=None, hardware=None):
+    """Publish system statistics sampled by refresh_node_status
+
+    A memory or hardware sample that is None (late or failed) keeps the
+    previously published values.
+    """
     # Update hardware info periodically (real-time usage stats)
-    hardware = get_hardware_info()
-    node_state['hardware'] = hardware
+    if hardware is not None:
+        node_state['hardware'] = hardware
+
+    # Publish the new system block in one assignment so readers never see a half-updated dict.
+    # Reuse the hardware CPU sample: a second non-blocking read right after would cover ~0 s
+    system = dict(node_state['system'])
+    if hardware is not None:
+        system['cpu_percent'] = hardware['cpu'].get('usage_percent', 0)
+    if memory is not None:
+        system['memory_percent'] = memory.percent
+    system['gpu_info'] = gpu_info
+
+    # Agent process metrics, read from a single /proc snapshot
+    try:
+        with _proc.oneshot():
+            system['agent_memory_mb'] = round(_proc.memory_info().rss / (1024**2), 1)
+            system['agent_threads'] = _proc.num_threads()
+            system['agent_cpu_percent'] = _proc.cpu_percent(interval=None)
+    except psutil.Error:
+        pass
+    node_state['system'] = system
 
     # Update uptime
-    if agent_stats["started_at"]:
-        agent_stats["uptime_seconds"] = (datetime.now() - datetime.fromisoformat(agent_stats["started_at"])).total_seconds()
+    if agent_stats["started_monotonic"] is not None:
+        agent_stats["uptime_seconds"] = time.monotonic() - agent_stats["started_monotonic"]
 
 
-def update_services():
+def update_services(ollama_status=None, comfyui_status=None):
     """Update Ollama and ComfyUI status"""
-    ollama_status = check_ollama()
-    node_state['ollama']['available'] = ollama_status['available']
-    node_state['ollama']['models'] = ollama_status['models']
+    if ollama_status is None:
+        ollama_status = check_ollama()
+    if comfyui_status is None:
+        comfyui_status = check_comfyui()
+
+    # Request handlers write current_job/jobs_completed into these same dicts, so
+    # publish the probe fields with one update() each rather than swapping the dicts
+    # out (which could drop a concurrent job write). Keys are predeclared in node_state,
+    # so readers serializing the dict never see its size change mid-iteration.
+    node_state['ollama'].update({
+        'available': ollama_status['available'],
+        'models': ollama_status['models']
+    })
+    node_state['comfyui'].update({
+        'available': comfyui_status['available'],
+        'models_info': comfyui_status.get('models_info', {})
+    })
+
+
+# Wall-clock budget for one refresh fan-out, above the slowest ComfyUI chain:
+# last-good GET (3) + HEAD / (2) + endpoint walk (5) + /object_info (10) = 20 s.
+# Kept under HEARTBEAT_INTERVAL so a stalled probe never delays the next beat.
+PROBE_DEADLINE = 25  # seconds
+
+
+def refresh_node_status():
+    """Run the service probes and system samplers concurrently, then publish the results"""
+    futures = {
+        probe_executor.submit(check_ollama): 'ollama',
+        probe_executor.submit(check_comfyui): 'comfyui',
+        probe_executor.submit(psutil.virtual_memory): 'memory',
+        probe_executor.submit(get_hardware_info): 'hardware',
+    }
+    done, late = wait(futures, timeout=PROBE_DEADLINE)
+    results = {}
+    for future in done:
+        try:
+            results[futures[future]] = future.result()
+        except Exception as e:
+            print(f"[Status] Probe {futures[future]} failed: {e}")
+
+    # A probe that fails or misses the deadline keeps its previously published
+    # values instead of holding up the rest (a late one finishes in the background)
+    if late:
+        print(f"[Status] Probes timed out: {', '.join(sorted(futures[f] for f in late))}")
+    ollama, comfyui = node_state['ollama'], node_state['comfyui']
+    results.setdefault('ollama', {"available": ollama['available'], "models": ollama['models']})
+    results.setdefault('comfyui', {"available": comfyui['available'], "models_info": comfyui['models_info']})
+
+    update_system_stats(memory=results.get('memory'), gpu_info=get_gpu_info(),
+                        hardware=results.get('hardware'))
+    update_services(ollama_status=results['ollama'], comfyui_status=results['comfyui'])
+
+    # Pick up address changes (at most once per LOCAL_IPS_TTL) for the heartbeat
+    ips = get_local_ips()
+    if node_static and ips != node_static['ip_addresses']:
+        node_state['ip_addresses'] = ips
+        freeze_node_static()
+
+
+# Identity fields that are fixed once main() has initialized node_state
+node_static = MappingProxyType({})
+
+
+def freeze_node_static():
+    """Snapshot the static identity fields sent with every heartbeat"""
+    global node_static
+    node_static = MappingProxyType({
+        "node_id": node_state['node_id'],
+        "hostname": node_state['hostname'],
+        "ip_addresses": tuple(node_state['ip_addresses']),
+        "agent_port": node_state.get('agent_port', DEFAULT_PORT)
+    })
+
+
+# Hash of the last full heartbeat payload (minus timestamp) and when it was sent
+HEARTBEAT_MAX_IDLE = 300  # seconds; send the full payload at least this often
+HEARTBEAT_GZIP_MIN_BYTES = 1024  # smaller bodies aren't worth compressing
+# models_hash is the model-list hash the server last confirmed storing; while it
+# matches, full heartbeats leave the (large) model lists out
+last_beat = {"hash": None, "full_sent": 0.0, "models_hash": None}
+
+
+def encode_json(obj) -> bytes:
+    """Serialize to JSON bytes (orjson if available)"""
+    if orjson:
+        return orjson.dumps(obj, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=json_default).encode('utf-8')
+
+
+GAUGE_BUCKET_PERCENT = 5  # gauge moves within one bucket don't force a full heartbeat
+
+
+def gauge_bucket(value) -> Optional[int]:
+    """Coarse bucket of a percentage gauge for heartbeat change detection"""
+    return None if value is None else int(value // GAUGE_BUCKET_PERCENT)
+
+
+def heartbeat_fingerprint(payload: Dict) -> Dict:
+    """Heartbeat payload with its gauges bucketed, for change detection
+
+    Resampled CPU/memory/GPU noise within a bucket doesn't count as a change,
+    a real shift (e.g. GPU utilization rising) does. The agent's own process
+    metrics are left out entirely.
+    """
+    system = payload["system"]
+    gpus = (system.get("gpu_info") or {}).get("gpus", [])
+    return {
+        **payload,
+        "system": {
+            "platform": system["platform"],
+            "platform_version": system["platform_version"],
+            "python_version": system["python_version"],
+            "cpu_percent": gauge_bucket(system["cpu_percent"]),
+            "memory_percent": gauge_bucket(system["memory_percent"]),
+            "gpus": [(
+                gpu["name"],
+                gauge_bucket(gpu["utilization_percent"]),
+                gauge_bucket(gpu["memory_used_mb"] * 100 / gpu["memory_total_mb"]) if gpu["memory_total_mb"] else None
+            ) for gpu in gpus]
+        }
+    }
 
-    comfyui_status = check_comfyui()
-    node_state['comfyui']['available'] = comfyui_status['available']
-    node_state['comfyui']['models_info'] = comfyui_status.get('models_info', {})
+
+def post_heartbeat(body: bytes):
+    """POST a full heartbeat body, gzipped when it is large enough to benefit"""
+    headers = {"Content-Type": "application/json"}
+    if len(body) >= HEARTBEAT_GZIP_MIN_BYTES:
+        # The payload is repetitive JSON; level 1 gets most of the size win for little CPU
+        body = gzip.compress(body, compresslevel=1)
+        headers["Content-Encoding"] = "gzip"
+    return SESSION.post(
+        f"{node_state['central_server']}/api/nodes/heartbeat",
+        data=body,
+        headers=headers,
+        timeout=10
+    )
 
 
 def send_heartbeat():
@@ -966,47 +1713,89 @@ def send_heartbeat():
         return
 
     try:
+        timestamp = datetime.now().isoformat()
+        # Take each subtree once so the payload is built from a consistent snapshot
+        ollama = node_state['ollama']
+        comfyui = node_state['comfyui']
         payload = {
-            "node_id": node_state['node_id'],
-            "hostname": node_state['hostname'],
-            "ip_addresses": node_state['ip_addresses'],
-            "agent_port": node_state.get('agent_port', DEFAULT_PORT),
+            **node_static,
             "ollama": {
-                "available": node_state['ollama']['available'],
-                "port": node_state['ollama']['port'],
+                "available": ollama['available'],
+                "port": ollama['port'],
                 "models": get_enabled_ollama_models(),  # Only broadcast enabled models
-                "all_models": node_state['ollama']['models'],  # Full list for reference
-                "current_job": node_state['ollama']['current_job'],
-                "jobs_completed": node_state['ollama']['jobs_completed']
+                "all_models": ollama['models'],  # Full list for reference
+                "current_job": ollama['current_job'],
+                "jobs_completed": ollama['jobs_completed']
             },
             "comfyui": {
-                "available": node_state['comfyui']['available'],
-                "port": node_state['comfyui']['port'],
-                "models_info": node_state['comfyui'].get('models_info', {}),
-                "current_job": node_state['comfyui']['current_job'],
-                "jobs_completed": node_state['comfyui']['jobs_completed']
+                "available": comfyui['available'],
+                "port": comfyui['port'],
+                "models_info": comfyui.get('models_info', {}),
+                "current_job": comfyui['current_job'],
+                "jobs_completed": comfyui['jobs_completed']
             },
             "workflows": {
                 "supported": list(WORKFLOW_REGISTRY.keys()),
-                "ready": [
-                    wf_id for wf_id in WORKFLOW_REGISTRY
-                    if check_workflow_model_availability(wf_id).get("all_available", False)
-                ]
+                "ready": ready_workflows()
             },
-            "system": node_state['system'],
-            "timestamp": datetime.now().isoformat()
+            "system": node_state['system']
         }
 
-        response = requests.post(
-            f"{node_state['central_server']}/api/nodes/heartbeat",
-            json=payload,
-            timeout=10
-        )
+        # Nothing material changed since the last full heartbeat: just tell the server
+        # we're alive, unless it has been too long or it lost us
+        payload_hash = hashlib.blake2s(encode_json(heartbeat_fingerprint(payload))).digest()
+        now = time.monotonic()
+        if payload_hash == last_beat["hash"] and now - last_beat["full_sent"] < HEARTBEAT_MAX_IDLE:
+            response = SESSION.post(
+                f"{node_state['central_server']}/api/nodes/heartbeat",
+                params={"beat_only": 1, "node_id": node_static['node_id'], "timestamp": timestamp},
+                timeout=10
+            )
+            if response.ok:
+                node_state['last_heartbeat'] = timestamp
+                print(f"[Heartbeat] Beat sent to {node_state['central_server']} (no changes)")
+                return
+            # 409 means the server doesn't know this node (e.g. it restarted); older
+            # servers reject the empty body. Either way, fall back to the full state.
+
+        payload["timestamp"] = timestamp
+
+        # Model lists (hundreds of LoRAs/checkpoints on some nodes) rarely change;
+        # once the server has confirmed a hash, send the hash instead of the lists
+        models_hash = hashlib.blake2s(encode_json([
+            payload["ollama"]["models"], payload["ollama"]["all_models"], payload["comfyui"]["models_info"]
+        ]), digest_size=16).hexdigest()
+        payload["models_hash"] = models_hash
+        response = None
+        if models_hash == last_beat["models_hash"]:
+            slim = {
+                **payload,
+                "ollama": {k: v for k, v in payload["ollama"].items() if k not in ("models", "all_models")},
+                "comfyui": {k: v for k, v in payload["comfyui"].items() if k != "models_info"},
+                "models_unchanged": True
+            }
+            response = post_heartbeat(encode_json(slim))
+            if response.status_code == 409:
+                # The server lost or never stored our model lists: resend them below
+                last_beat["models_hash"] = None
+                response = None
+        if response is None:
+            response = post_heartbeat(encode_json(payload))
 
         if response.ok:
-            node_state['last_heartbeat'] = datetime.now().isoformat()
+            node_state['last_heartbeat'] = timestamp
+            last_beat["hash"] = payload_hash
+            last_beat["full_sent"] = now
+            # Servers without models_hash support don't echo it back, so they keep
+            # getting the full lists
+            try:
+                last_beat["models_hash"] = response.json().get("models_hash")
+            except ValueError:
+                last_beat["models_hash"] = None
             print(f"[Heartbeat] Sent to {node_state['central_server']}")
         else:
+            last_beat["hash"] = None
+            last_beat["models_hash"] = None
             print(f"[!] Heartbeat failed: {response.status_code}")
     except Exception as e:
         print(f"[!] Heartbeat error: {e}")
@@ -1023,8 +1812,7 @@ def background_tasks():
 
     while True:
         try:
-            update_system_stats()
-            update_services()
+            refresh_node_status()
             send_heartbeat()
 
             # Increment heartbeat counter
@@ -1062,7 +1850,6 @@ DASHBOARD_HTML = """
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta http-equiv="refresh" content="10">
     <title>Node Agent - {{ hostname }}</title>
     <style>
         * { box-sizing: border-box; margin: 0; padding: 0; }
@@ -1418,33 +2205,33 @@ DASHBOARD_HTML = """
                 <h2>📊 Real-time Resources</h2>
                 <div class="metric">
                     <span class="metric-label">CPU Usage</span>
-                    <span class="metric-value">{{ system.cpu_percent }}%</span>
+                    <span class="metric-value" data-metric="cpu_percent" data-suffix="%">{{ system.cpu_percent }}%</span>
                 </div>
                 <div class="progress-bar">
-                    <div class="progress-fill progress-cpu" style="width: {{ system.cpu_percent }}%"></div>
+                    <div class="progress-fill progress-cpu" data-bar="cpu_percent" style="width: {{ system.cpu_percent }}%"></div>
                 </div>
                 <div class="metric" style="margin-top: 15px;">
                     <span class="metric-label">Memory</span>
-                    <span class="metric-value">{{ hardware.memory.used_gb if hardware.memory else '?' }} / {{ hardware.memory.total_gb if hardware.memory else '?' }} GB ({{ system.memory_percent }}%)</span>
+                    <span class="metric-value" data-metric="memory_text">{{ hardware.memory.used_gb if hardware.memory else '?' }} / {{ hardware.memory.total_gb if hardware.memory else '?' }} GB ({{ system.memory_percent }}%)</span>
                 </div>
                 <div class="progress-bar">
-                    <div class="progress-fill progress-mem" style="width: {{ system.memory_percent }}%"></div>
+                    <div class="progress-fill progress-mem" data-bar="memory_percent" style="width: {{ system.memory_percent }}%"></div>
                 </div>
                 {% if hardware.gpu %}
                 {% for gpu in hardware.gpu %}
                 <div class="metric" style="margin-top: 15px;">
                     <span class="metric-label">GPU {{ loop.index0 }}</span>
-                    <span class="metric-value">{{ gpu.utilization_gpu_percent if gpu.utilization_gpu_percent else '?' }}%</span>
+                    <span class="metric-value" data-metric="gpu{{ loop.index0 }}_util" data-suffix="%">{{ gpu.utilization_gpu_percent if gpu.utilization_gpu_percent else '?' }}%</span>
                 </div>
                 <div class="progress-bar">
-                    <div class="progress-fill progress-gpu" style="width: {{ gpu.utilization_gpu_percent if gpu.utilization_gpu_percent else 0 }}%"></div>
+                    <div class="progress-fill progress-gpu" data-bar="gpu{{ loop.index0 }}_util" style="width: {{ gpu.utilization_gpu_percent if gpu.utilization_gpu_percent else 0 }}%"></div>
                 </div>
                 <div class="metric">
                     <span class="metric-label">VRAM</span>
-                    <span class="metric-value">{{ gpu.memory_used_mb }} / {{ gpu.memory_total_mb }} MB ({{ gpu.memory_usage_percent }}%)</span>
+                    <span class="metric-value" data-metric="gpu{{ loop.index0 }}_vram_text">{{ gpu.memory_used_mb }} / {{ gpu.memory_total_mb }} MB ({{ gpu.memory_usage_percent }}%)</span>
                 </div>
                 <div class="progress-bar">
-                    <div class="progress-fill progress-gpu" style="width: {{ gpu.memory_usage_percent }}%"></div>
+                    <div class="progress-fill progress-gpu" data-bar="gpu{{ loop.index0 }}_vram" style="width: {{ gpu.memory_usage_percent }}%"></div>
                 </div>
                 {% if gpu.temperature_c %}
                 <div class="metric">
@@ -1476,19 +2263,19 @@ DASHBOARD_HTML = """
                 </div>
                 <div class="metric">
                     <span class="metric-label">Jobs Completed</span>
-                    <span class="metric-value">{{ ollama.jobs_completed }}</span>
+                    <span class="metric-value" data-metric="ollama_jobs_completed">{{ ollama.jobs_completed }}</span>
                 </div>
                 {% if ollama.available %}
                 <div class="metric">
                     <span class="metric-label">Models ({{ enabled_models | length }} enabled / {{ ollama.models | length }} total)</span>
                 </div>
                 <div class="model-list">
-                    {% for model in ollama.models %}
-                    <div class="model-item model-toggle {% if model in enabled_models %}model-enabled{% else %}model-disabled{% endif %}"
-                         onclick="toggleModel('{{ model }}')"
-                         title="Click to {{ 'disable' if model in enabled_models else 'enable' }}">
-                        <span class="model-status">{% if model in enabled_models %}✓{% else %}✗{% endif %}</span>
-                        {{ model }}
+                    {% for model in ollama_models %}
+                    <div class="model-item model-toggle {% if model.enabled %}model-enabled{% else %}model-disabled{% endif %}"
+                         onclick="toggleModel('{{ model.name }}')"
+                         title="Click to {{ 'disable' if model.enabled else 'enable' }}">
+                        <span class="model-status">{% if model.enabled %}✓{% else %}✗{% endif %}</span>
+                        {{ model.name }}
                     </div>
                     {% endfor %}
                 </div>
@@ -1518,7 +2305,7 @@ DASHBOARD_HTML = """
                 </div>
                 <div class="metric">
                     <span class="metric-label">Jobs Completed</span>
-                    <span class="metric-value">{{ comfyui.jobs_completed }}</span>
+                    <span class="metric-value" data-metric="comfyui_jobs_completed">{{ comfyui.jobs_completed }}</span>
                 </div>
                 <div class="job-card {{ 'idle' if not comfyui.current_job else '' }}">
                     {% if comfyui.current_job %}
@@ -1581,7 +2368,7 @@ DASHBOARD_HTML = """
                 <h2>🦙 Ollama Stats</h2>
                 <div class="metric">
                     <span class="metric-label">Total Requests</span>
-                    <span class="metric-value">{{ stats.ollama.total_requests }}</span>
+                    <span class="metric-value" data-metric="ollama_total_requests">{{ stats.ollama.total_requests }}</span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Success Rate</span>
@@ -1589,11 +2376,11 @@ DASHBOARD_HTML = """
                 </div>
                 <div class="metric">
                     <span class="metric-label">Avg Response Time</span>
-                    <span class="metric-value">{{ stats.ollama.avg_response_time_ms|round(0) }} ms</span>
+                    <span class="metric-value" data-metric="ollama_avg_response_time_ms" data-suffix=" ms">{{ stats.ollama.avg_response_time_ms|round(0) }} ms</span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Requests/min</span>
-                    <span class="metric-value">{{ stats.ollama.requests_per_minute }}</span>
+                    <span class="metric-value" data-metric="ollama_requests_per_minute">{{ stats.ollama.requests_per_minute }}</span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Tokens Generated</span>
@@ -1618,7 +2405,7 @@ DASHBOARD_HTML = """
                 <h2>🎨 ComfyUI Stats</h2>
                 <div class="metric">
                     <span class="metric-label">Total Requests</span>
-                    <span class="metric-value">{{ stats.comfyui.total_requests }}</span>
+                    <span class="metric-value" data-metric="comfyui_total_requests">{{ stats.comfyui.total_requests }}</span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Success Rate</span>
@@ -1626,11 +2413,11 @@ DASHBOARD_HTML = """
                 </div>
                 <div class="metric">
                     <span class="metric-label">Avg Response Time</span>
-                    <span class="metric-value">{{ stats.comfyui.avg_response_time_ms|round(0) }} ms</span>
+                    <span class="metric-value" data-metric="comfyui_avg_response_time_ms" data-suffix=" ms">{{ stats.comfyui.avg_response_time_ms|round(0) }} ms</span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Requests/min</span>
-                    <span class="metric-value">{{ stats.comfyui.requests_per_minute }}</span>
+                    <span class="metric-value" data-metric="comfyui_requests_per_minute">{{ stats.comfyui.requests_per_minute }}</span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Renders Completed</span>
@@ -1706,7 +2493,7 @@ DASHBOARD_HTML = """
         </div>
 
         <footer>
-            Story Generator Node Agent v1.1 | Uptime: {{ (stats.uptime_seconds // 3600)|int }}h {{ ((stats.uptime_seconds % 3600) // 60)|int }}m | Last updated: {{ now }}
+            Story Generator Node Agent v1.1 | Uptime: {{ (stats.uptime_seconds // 3600)|int }}h {{ ((stats.uptime_seconds % 3600) // 60)|int }}m | Last updated: <span data-metric="now">{{ now }}</span>
         </footer>
     </div>
 
@@ -1749,16 +2536,74 @@ DASHBOARD_HTML = """
                 alert('Error toggling model: ' + err);
             });
         }
+
+        // Live metrics pushed by /api/stream; reload only when the page layout changes
+        const pageStructure = '{{ structure }}';
+        const stream = new EventSource('/api/stream');
+        stream.onerror = () => {
+            // A refused stream (503: too many open) is not retried by EventSource;
+            // fall back to reloading the page now and then
+            if (stream.readyState === EventSource.CLOSED) {
+                setTimeout(() => location.reload(), 30000);
+            }
+        };
+        stream.onmessage = (event) => {
+            const diff = JSON.parse(event.data);
+            if ('structure' in diff && diff.structure !== pageStructure) {
+                stream.close();
+                location.reload();
+                return;
+            }
+            // "Last updated" is stamped here rather than sent, so an unchanged
+            // snapshot stays a keep-alive comment instead of a diff ('sv-SE' = YYYY-MM-DD HH:MM:SS)
+            diff.now = new Date().toLocaleString('sv-SE');
+            for (const [key, value] of Object.entries(diff)) {
+                document.querySelectorAll(`[data-metric="${key}"]`).forEach(el => {
+                    el.textContent = value + (el.dataset.suffix || '');
+                });
+                document.querySelectorAll(`[data-bar="${key}"]`).forEach(el => {
+                    el.style.width = value + '%';
+                });
+            }
+        };
     </script>
 </body>
 </html>
 """
 
+# Compiled once at import; render_template_string would re-parse it on every request.
+# The <head> (the large CSS block) only depends on the hostname, so it is split off,
+# rendered once, and streamed ahead of the dynamic body.
+_DASHBOARD_HEAD, _DASHBOARD_SPLIT, _DASHBOARD_BODY = DASHBOARD_HTML.partition('    <div class="container">')
+DASHBOARD_HEAD_TEMPLATE = app.jinja_env.from_string(_DASHBOARD_HEAD)
+DASHBOARD_TEMPLATE = app.jinja_env.from_string(_DASHBOARD_SPLIT + _DASHBOARD_BODY)
+
+
+@lru_cache(maxsize=1)
+def dashboard_head() -> bytes:
+    """Rendered dashboard <head>, encoded once"""
+    return DASHBOARD_HEAD_TEMPLATE.render(hostname=node_state['hostname']).encode('utf-8')
+
 
 # API Routes
 @app.route('/')
 def dashboard():
-    """Render the dashboard UI"""
+    """Render the dashboard UI, streaming the static head before the body is rendered"""
+    def generate():
+        yield dashboard_head()
+        yield render_dashboard_body()
+
+    return Response(stream_with_context(generate()), mimetype='text/html')
+
+
+def render_dashboard_body() -> str:
+    """Render the dynamic part of the dashboard"""
+    # Resolve each model's enabled flag here (one set lookup) rather than with
+    # repeated list membership tests inside the template loop
+    enabled_models = get_enabled_ollama_models()
+    enabled_set = set(enabled_models)
+    ollama_models = [{"name": m, "enabled": m in enabled_set} for m in node_state['ollama']['models']]
+
     # Prepare workflow data for template (without the full JSON for display)
     workflows_display = {}
     for wf_id, wf in WORKFLOW_REGISTRY.items():
@@ -1800,24 +2645,104 @@ def dashboard():
         "uptime_seconds": agent_stats["uptime_seconds"]
     }
 
-    return render_template_string(
-        DASHBOARD_HTML,
+    return render_template(
+        DASHBOARD_TEMPLATE,
         **node_state,
-        enabled_models=get_enabled_ollama_models(),
+        enabled_models=enabled_models,
+        ollama_models=ollama_models,
         workflows=workflows_display,
         workflow_availability=workflow_availability,
         stats=stats_for_template,
-        ollama_logs=communication_logs["ollama"],
-        comfyui_logs=communication_logs["comfyui"],
-        now=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        ollama_logs=snapshot_logs("ollama"),
+        comfyui_logs=snapshot_logs("comfyui"),
+        now=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        structure=dashboard_snapshot()["structure"]
     )
 
 
+STREAM_INTERVAL = 2  # seconds between dashboard stream checks
+STREAM_MAX_SECONDS = 300  # a stream ends after this long; EventSource reconnects on its own
+MAX_DASHBOARD_STREAMS = 4  # concurrent /api/stream clients, each holds a server thread
+# Streams are capped so open dashboard tabs can't take every server thread away
+# from the API and proxy routes (waitress gets MAX_DASHBOARD_STREAMS extra threads)
+stream_slots = threading.BoundedSemaphore(MAX_DASHBOARD_STREAMS)
+
+
+def dashboard_snapshot() -> Dict:
+    """Values the dashboard updates in place, plus a hash of everything that needs a re-render"""
+    system = node_state['system']
+    hardware = node_state['hardware']
+    memory = hardware.get('memory') or {}
+    ollama = node_state['ollama']
+    comfyui = node_state['comfyui']
+
+    snapshot = {
+        "cpu_percent": system['cpu_percent'],
+        "memory_percent": system['memory_percent'],
+        "memory_text": f"{memory.get('used_gb', '?')} / {memory.get('total_gb', '?')} GB ({system['memory_percent']}%)",
+        "ollama_jobs_completed": ollama['jobs_completed'],
+        "comfyui_jobs_completed": comfyui['jobs_completed']
+    }
+    for service in ("ollama", "comfyui"):
+        stats = agent_stats[service]
+        snapshot[f"{service}_total_requests"] = stats["total_requests"]
+        snapshot[f"{service}_requests_per_minute"] = stats["requests_per_minute"]
+        snapshot[f"{service}_avg_response_time_ms"] = round(stats["avg_response_time_ms"])
+    gpus = hardware.get('gpu') or []
+    for i, gpu in enumerate(gpus):
+        snapshot[f"gpu{i}_util"] = gpu.get('utilization_gpu_percent') or 0
+        snapshot[f"gpu{i}_vram"] = gpu.get('memory_usage_percent', 0)
+        snapshot[f"gpu{i}_vram_text"] = f"{gpu.get('memory_used_mb')} / {gpu.get('memory_total_mb')} MB ({gpu.get('memory_usage_percent')}%)"
+
+    # Service status, models, jobs and new log entries change the page layout; the
+    # client reloads when this hash changes instead of patching those sections.
+    # Logs are keyed by their newest entry id: the length stops changing once full.
+    structure = [
+        ollama['available'], comfyui['available'],
+        ollama['models'], get_enabled_ollama_models(),
+        ollama['current_job'], comfyui['current_job'],
+        len(gpus),
+        newest_log_id("ollama"), newest_log_id("comfyui")
+    ]
+    snapshot["structure"] = hashlib.blake2s(encode_json(structure), digest_size=8).hexdigest()
+    return snapshot
+
+
+@app.route('/api/stream')
+def api_stream():
+    """Server-Sent Events feed of dashboard changes (only keys whose value changed)"""
+    if not stream_slots.acquire(blocking=False):
+        return jsonify({"error": "Too many dashboard streams open"}), 503
+
+    def event_stream():
+        # Ask the browser to reconnect quickly once this stream ends
+        yield f"retry: {STREAM_INTERVAL * 1000}\n\n"
+        last = {}
+        deadline = time.monotonic() + STREAM_MAX_SECONDS
+        while time.monotonic() < deadline:
+            snapshot = dashboard_snapshot()
+            diff = {key: value for key, value in snapshot.items() if last.get(key) != value}
+            if diff:
+                yield f"data: {encode_json(diff).decode('utf-8')}\n\n"
+                last = snapshot
+            else:
+                # Comment line keeps proxies from timing out and surfaces closed clients
+                yield ": keep-alive\n\n"
+            time.sleep(STREAM_INTERVAL)
+
+    response = Response(event_stream(), mimetype='text/event-stream',
+                        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+    # Runs when the server closes the response (stream ended or client went away)
+    response.call_on_close(stream_slots.release)
+    return response
+
+
 @app.route('/api/status')
 def api_status():
     """Get full node status as JSON"""
     return jsonify({
         **node_state,
+        "jobs_history": list(node_state['jobs_history']),
         "timestamp": datetime.now().isoformat()
     })
 
@@ -1965,10 +2890,9 @@ def api_job_start():
         "started_at": datetime.now().isoformat()
     }
 
-    if service == 'ollama':
-        node_state['ollama']['current_job'] = job_info
-    else:
-        node_state['comfyui']['current_job'] = job_info
+    # Anything that isn't an Ollama job is tracked against ComfyUI
+    svc = node_state['ollama' if service == 'ollama' else 'comfyui']
+    svc['current_job'] = job_info
 
     return jsonify({"status": "ok", "job": job_info})
 
@@ -1979,24 +2903,14 @@ def api_job_complete():
     data = request.json
     service = data.get('service', 'ollama')
 
-    if service == 'ollama':
-        job = node_state['ollama']['current_job']
-        if job:
-            job['completed_at'] = datetime.now().isoformat()
-            job['status'] = data.get('status', 'completed')
-            node_state['jobs_history'].insert(0, job)
-            node_state['jobs_history'] = node_state['jobs_history'][:50]  # Keep last 50
-            node_state['ollama']['jobs_completed'] += 1
-        node_state['ollama']['current_job'] = None
-    else:
-        job = node_state['comfyui']['current_job']
-        if job:
-            job['completed_at'] = datetime.now().isoformat()
-            job['status'] = data.get('status', 'completed')
-            node_state['jobs_history'].insert(0, job)
-            node_state['jobs_history'] = node_state['jobs_history'][:50]
-            node_state['comfyui']['jobs_completed'] += 1
-        node_state['comfyui']['current_job'] = None
+    svc = node_state['ollama' if service == 'ollama' else 'comfyui']
+    job = svc['current_job']
+    if job:
+        job['completed_at'] = datetime.now().isoformat()
+        job['status'] = data.get('status', 'completed')
+        node_state['jobs_history'].appendleft(job)
+        svc['jobs_completed'] += 1
+    svc['current_job'] = None
 
     return jsonify({"status": "ok"})
 
@@ -2004,7 +2918,7 @@ def api_job_complete():
 @app.route('/api/jobs/history')
 def api_jobs_history():
     """Get job history"""
-    return jsonify({"jobs": node_state['jobs_history']})
+    return jsonify({"jobs": list(node_state['jobs_history'])})
 
 
 # Workflow API endpoints
@@ -2040,11 +2954,8 @@ def api_workflow_download(workflow_id):
     if workflow_id not in WORKFLOW_REGISTRY:
         return jsonify({"error": f"Workflow '{workflow_id}' not found"}), 404
 
-    workflow = WORKFLOW_REGISTRY[workflow_id]
-    workflow_json = workflow.get("workflow_json", {})
-
     response = app.response_class(
-        response=json.dumps(workflow_json, indent=2),
+        response=workflow_download(workflow_id),
         status=200,
         mimetype='application/json'
     )
@@ -2052,6 +2963,30 @@ def api_workflow_download(workflow_id):
     return response
 
 
+@app.route('/api/workflows/<workflow_id>/render', methods=['POST'])
+def api_workflow_render(workflow_id):
+    """Return the workflow's ComfyUI API JSON with prompts and seed filled in"""
+    if workflow_id not in WORKFLOW_REGISTRY:
+        return jsonify({"error": f"Workflow '{workflow_id}' not found"}), 404
+
+    data = request.json or {}
+    try:
+        seed = int(data['seed']) if data.get('seed') is not None else random.getrandbits(48)
+    except (TypeError, ValueError):
+        return jsonify({"error": "seed must be an integer"}), 400
+
+    return app.response_class(
+        response=render_workflow(
+            workflow_id,
+            str(data.get('positive_prompt', '')),
+            str(data.get('negative_prompt', '')),
+            seed
+        ),
+        status=200,
+        mimetype='application/json'
+    )
+
+
 @app.route('/api/workflows/<workflow_id>/availability')
 def api_workflow_availability(workflow_id):
     """Check if all models required by a workflow are available"""
@@ -2077,13 +3012,28 @@ def api_comfyui_models():
     })
 
 
+@app.route('/api/comfyui/models/refresh', methods=['POST'])
+def api_comfyui_models_refresh():
+    """Refetch ComfyUI model lists now instead of waiting for the cache to expire"""
+    invalidate_comfyui_models()
+    status = check_comfyui()
+    node_state['comfyui'].update({
+        'available': status['available'],
+        'models_info': status['models_info']
+    })
+    return jsonify({
+        "models": node_state['comfyui']['models_info'],
+        "available": node_state['comfyui']['available']
+    })
+
+
 # Communication Logs API endpoints
 @app.route('/api/logs')
 def api_logs():
     """Get all communication logs"""
     return jsonify({
-        "ollama": communication_logs["ollama"],
-        "comfyui": communication_logs["comfyui"]
+        "ollama": snapshot_logs("ollama"),
+        "comfyui": snapshot_logs("comfyui")
     })
 
 
@@ -2092,7 +3042,7 @@ def api_logs_service(service):
     """Get logs for a specific service (ollama or comfyui)"""
     if service not in communication_logs:
         return jsonify({"error": f"Unknown service '{service}'. Use 'ollama' or 'comfyui'"}), 400
-    return jsonify({"logs": communication_logs[service]})
+    return jsonify({"logs": snapshot_logs(service)})
 
 
 @app.route('/api/logs/<service>/clear', methods=['POST'])
@@ -2100,7 +3050,8 @@ def api_logs_clear(service):
     """Clear logs for a specific service"""
     if service not in communication_logs:
         return jsonify({"error": f"Unknown service '{service}'"}), 400
-    communication_logs[service] = []
+    with logs_lock:
+        communication_logs[service].clear()
     return jsonify({"status": "ok", "message": f"Cleared {service} logs"})
 
 
@@ -2131,14 +3082,10 @@ def api_stats():
     """
     # Clean up old request timestamps
     now = datetime.now()
-    one_minute_ago = now.timestamp() - 60
 
-    for service in ["ollama", "comfyui"]:
-        agent_stats[service]["requests_last_minute"] = [
-            t for t in agent_stats[service]["requests_last_minute"]
-            if t.timestamp() > one_minute_ago
-        ]
-        agent_stats[service]["requests_per_minute"] = len(agent_stats[service]["requests_last_minute"])
+    with stats_lock:
+        for service in ["ollama", "comfyui"]:
+            prune_requests_last_minute(agent_stats[service], time.monotonic())
 
     # Build response without the internal timestamp objects
     stats_response = {
@@ -2184,23 +3131,25 @@ def api_stats():
 @app.route('/api/stats/reset', methods=['POST'])
 def api_stats_reset():
     """Reset all statistics counters"""
-    for service in ["ollama", "comfyui"]:
-        agent_stats[service].update({
-            "total_requests": 0,
-            "successful_requests": 0,
-            "failed_requests": 0,
-            "total_response_time_ms": 0,
-            "avg_response_time_ms": 0,
-            "min_response_time_ms": None,
-            "max_response_time_ms": None,
-            "requests_per_minute": 0,
-            "success_rate": 100.0,
-            "current_queue_depth": 0,
-            "recent_response_times": [],
-            "requests_last_minute": [],
-            "last_error": None,
-            "last_error_time": None
-        })
+    with stats_lock:
+        for service in ["ollama", "comfyui"]:
+            agent_stats[service].update({
+                "total_requests": 0,
+                "successful_requests": 0,
+                "failed_requests": 0,
+                "total_response_time_ms": 0,
+                "avg_response_time_ms": 0,
+                "min_response_time_ms": None,
+                "max_response_time_ms": None,
+                "requests_per_minute": 0,
+                "success_rate": 100.0,
+                "current_queue_depth": 0,
+                "recent_response_times": deque(maxlen=STATS_HISTORY_SIZE),
+                "recent_response_sum_ms": 0,
+                "requests_last_minute": deque(),
+                "last_error": None,
+                "last_error_time": None
+            })
     return jsonify({"status": "ok", "message": "Statistics reset"})
 
 
@@ -2209,9 +3158,10 @@ def api_hardware():
     """
     Get detailed hardware information.
     Useful for understanding node capabilities and making informed load balancing decisions.
+    Pass ?detail=1 for the full per-core CPU usage list.
     """
     # Get fresh hardware info
-    hardware = get_hardware_info()
+    hardware = get_hardware_info(per_core=request.args.get('detail') == '1')
     return jsonify({
         "hardware": hardware,
         "hostname": node_state['hostname'],
@@ -2450,10 +3400,7 @@ def api_load_balance_info():
         "comfyui": {
             "available": node_state['comfyui']['available'],
             "busy": node_state['comfyui']['current_job'] is not None,
-            "workflows_ready": len([
-                w for w in WORKFLOW_REGISTRY
-                if check_workflow_model_availability(w).get("all_available", False)
-            ]),
+            "workflows_ready": len(ready_workflows()),
             "avg_response_ms": round(agent_stats["comfyui"]["avg_response_time_ms"], 0),
             "success_rate": round(agent_stats["comfyui"]["success_rate"], 1),
             "rpm": agent_stats["comfyui"]["requests_per_minute"]
@@ -2480,12 +3427,18 @@ def proxy_ollama(path):
     """
     ollama_url = f"http://localhost:{node_state['ollama']['port']}/{path}"
     endpoint = f"/{path}"
+    slot = None  # submission slot held by this request, released in the finally below
 
     try:
-        start_time = datetime.now()
+        start_time = time.monotonic_ns()
 
         # Get request data
         if request.method in ['POST', 'PUT']:
+            # Wait for a submission slot; under a burst this applies backpressure
+            # instead of piling every request onto the upstream queue at once
+            if not submission_slots["ollama"].acquire(timeout=SUBMISSION_WAIT_TIMEOUT):
+                return jsonify({"error": "Too many concurrent submissions, retry later"}), 503
+            slot = submission_slots["ollama"]
             req_data = request.get_json(silent=True) or {}
             log_ollama_request(endpoint, req_data)
 
@@ -2494,11 +3447,11 @@ def proxy_ollama(path):
                 node_state['ollama']['current_job'] = {
                     "type": "generation" if 'generate' in path else "chat",
                     "model": req_data.get('model', 'unknown'),
-                    "started_at": start_time.isoformat(),
+                    "started_at": datetime.now().isoformat(),
                     "prompt_preview": str(req_data.get('prompt', req_data.get('messages', '')))[:100]
                 }
 
-            response = requests.request(
+            response = SESSION.request(
                 method=request.method,
                 url=ollama_url,
                 json=req_data,
@@ -2508,7 +3461,7 @@ def proxy_ollama(path):
             )
         else:
             log_ollama_request(endpoint, None)
-            response = requests.request(
+            response = SESSION.request(
                 method=request.method,
                 url=ollama_url,
                 headers={k: v for k, v in request.headers if k.lower() != 'host'},
@@ -2534,7 +3487,7 @@ def proxy_ollama(path):
                         yield chunk
 
                 # Calculate duration and log
-                duration_ms = (datetime.now() - start_time).total_seconds() * 1000
+                duration_ms = elapsed_ms(start_time)
                 log_ollama_response(endpoint, start_time, ''.join(full_response)[:1000], status_code=response.status_code)
 
                 # Update stats
@@ -2545,11 +3498,16 @@ def proxy_ollama(path):
                     node_state['ollama']['current_job'] = None
                     node_state['ollama']['jobs_completed'] += 1
 
-            return app.response_class(generate(), mimetype=response.headers.get('Content-Type', 'application/json'))
+            relay = app.response_class(generate(), mimetype=response.headers.get('Content-Type', 'application/json'))
+            if slot is not None:
+                # A streamed generation keeps its slot until the stream is closed
+                relay.call_on_close(slot.release)
+                slot = None
+            return relay
 
         # Non-streaming response
         resp_data = response.json() if response.headers.get('Content-Type', '').startswith('application/json') else response.text
-        duration_ms = (datetime.now() - start_time).total_seconds() * 1000
+        duration_ms = elapsed_ms(start_time)
         log_ollama_response(endpoint, start_time, resp_data, status_code=response.status_code)
 
         # Update stats
@@ -2567,8 +3525,8 @@ def proxy_ollama(path):
 
     except Exception as e:
         error_msg = str(e)
-        duration_ms = (datetime.now() - start_time).total_seconds() * 1000 if 'start_time' in dir() else 0
-        log_ollama_response(endpoint, start_time if 'start_time' in dir() else datetime.now(), error=error_msg)
+        duration_ms = elapsed_ms(start_time) if 'start_time' in dir() else 0
+        log_ollama_response(endpoint, start_time if 'start_time' in dir() else time.monotonic_ns(), error=error_msg)
 
         # Update stats with failure
         update_stats("ollama", duration_ms, False, error=error_msg)
@@ -2578,6 +3536,9 @@ def proxy_ollama(path):
             node_state['ollama']['current_job'] = None
 
         return jsonify({"error": error_msg}), 500
+    finally:
+        if slot is not None:
+            slot.release()
 
 
 @app.route('/proxy/comfyui/<path:path>', methods=['GET', 'POST', 'PUT', 'DELETE'])
@@ -2588,12 +3549,18 @@ def proxy_comfyui(path):
     """
     comfyui_url = f"http://localhost:{node_state['comfyui']['port']}/{path}"
     endpoint = f"/{path}"
+    slot = None  # submission slot held by this request, released in the finally below
 
     try:
-        start_time = datetime.now()
+        start_time = time.monotonic_ns()
 
         # Get request data
         if request.method in ['POST', 'PUT']:
+            # Wait for a submission slot; under a burst this applies backpressure
+            # instead of piling every request onto the upstream queue at once
+            if not submission_slots["comfyui"].acquire(timeout=SUBMISSION_WAIT_TIMEOUT):
+                return jsonify({"error": "Too many concurrent submissions, retry later"}), 503
+            slot = submission_slots["comfyui"]
             req_data = request.get_json(silent=True) or {}
             log_comfyui_request(endpoint, req_data)
 
@@ -2603,11 +3570,11 @@ def proxy_comfyui(path):
                 node_state['comfyui']['current_job'] = {
                     "type": "render",
                     "workflow_nodes": len(workflow_nodes),
-                    "started_at": start_time.isoformat(),
+                    "started_at": datetime.now().isoformat(),
                     "client_id": req_data.get('client_id', 'unknown')
                 }
 
-            response = requests.request(
+            response = SESSION.request(
                 method=request.method,
                 url=comfyui_url,
                 json=req_data,
@@ -2616,14 +3583,14 @@ def proxy_comfyui(path):
             )
         else:
             log_comfyui_request(endpoint, {"method": request.method})
-            response = requests.request(
+            response = SESSION.request(
                 method=request.method,
                 url=comfyui_url,
                 headers={k: v for k, v in request.headers if k.lower() != 'host'},
                 timeout=30
             )
 
-        duration_ms = (datetime.now() - start_time).total_seconds() * 1000
+        duration_ms = elapsed_ms(start_time)
 
         # Check content type from ComfyUI response
         content_type = response.headers.get('Content-Type', '')
@@ -2661,8 +3628,8 @@ def proxy_comfyui(path):
 
     except Exception as e:
         error_msg = str(e)
-        duration_ms = (datetime.now() - start_time).total_seconds() * 1000 if 'start_time' in dir() else 0
-        log_comfyui_response(endpoint, start_time if 'start_time' in dir() else datetime.now(), error=error_msg)
+        duration_ms = elapsed_ms(start_time) if 'start_time' in dir() else 0
+        log_comfyui_response(endpoint, start_time if 'start_time' in dir() else time.monotonic_ns(), error=error_msg)
 
         # Update stats with failure
         update_stats("comfyui", duration_ms, False, error=error_msg)
@@ -2672,6 +3639,9 @@ def proxy_comfyui(path):
             node_state['comfyui']['current_job'] = None
 
         return jsonify({"error": error_msg}), 500
+    finally:
+        if slot is not None:
+            slot.release()
 
 
 @app.route('/proxy/comfyui/ws', methods=['GET'])
@@ -2701,8 +3671,7 @@ def api_comfyui_job_complete():
         job['output'] = data.get('output')
 
         # Add to history
-        node_state['jobs_history'].insert(0, {**job, 'service': 'comfyui'})
-        node_state['jobs_history'] = node_state['jobs_history'][:50]
+        node_state['jobs_history'].appendleft({**job, 'service': 'comfyui'})
 
         node_state['comfyui']['jobs_completed'] += 1
         node_state['comfyui']['current_job'] = None
@@ -2736,8 +3705,13 @@ def main():
     parser.add_argument('--ollama-port', type=int, default=DEFAULT_OLLAMA_PORT, help=f'Ollama port (default: {DEFAULT_OLLAMA_PORT})')
     parser.add_argument('--comfyui-port', type=int, default=DEFAULT_COMFYUI_PORT, help=f'ComfyUI port (default: {DEFAULT_COMFYUI_PORT})')
     parser.add_argument('--no-update', action='store_true', help='Skip auto-update check on startup')
+    parser.add_argument('--max-ollama-submissions', type=int, default=MAX_OLLAMA_SUBMISSIONS, help=f'Concurrent proxied Ollama POST/PUT requests (default: {MAX_OLLAMA_SUBMISSIONS})')
+    parser.add_argument('--max-comfyui-submissions', type=int, default=MAX_COMFYUI_SUBMISSIONS, help=f'Concurrent proxied ComfyUI POST/PUT requests (default: {MAX_COMFYUI_SUBMISSIONS})')
     args = parser.parse_args()
 
+    submission_slots["ollama"] = threading.BoundedSemaphore(max(1, args.max_ollama_submissions))
+    submission_slots["comfyui"] = threading.BoundedSemaphore(max(1, args.max_comfyui_submissions))
+
     # Auto-update check (only if server is specified and --no-update not set)
     if args.server and not args.no_update:
         print(f"\n[Agent v{AGENT_VERSION}] Checking for updates...")
@@ -2757,16 +3731,19 @@ def main():
     node_state['ollama']['port'] = args.ollama_port
     node_state['comfyui']['port'] = args.comfyui_port
     node_state['central_server'] = args.server
+    freeze_node_static()
 
     # Load model configuration from file
     load_config()
+    atexit.register(flush_config)
+    threading.Thread(target=config_writer, daemon=True).start()
 
     # Initialize stats tracking timestamp
     agent_stats["started_at"] = datetime.now().isoformat()
+    agent_stats["started_monotonic"] = time.monotonic()
 
     # Initial service check
-    update_services()
-    update_system_stats()
+    refresh_node_status()
 
     # Get hardware info for startup display
     hardware = node_state.get('hardware', {})
@@ -2822,8 +3799,18 @@ def main():
     bg_thread = threading.Thread(target=background_tasks, daemon=True)
     bg_thread.start()
 
-    # Run Flask app
-    app.run(host='0.0.0.0', port=args.port, debug=False, threaded=True)
+    # GPU sampling runs on its own schedule so nvidia-smi never delays a heartbeat
+    gpu_thread = threading.Thread(target=gpu_sampler, daemon=True)
+    gpu_thread.start()
+
+    # Run Flask app (waitress if installed, otherwise the werkzeug dev server)
+    if waitress_serve:
+        # Every held submission slot and dashboard stream occupies a thread; keep 8
+        # more for health, status and other API calls
+        server_threads = 8 + MAX_DASHBOARD_STREAMS + args.max_ollama_submissions + args.max_comfyui_submissions
+        waitress_serve(app, host='0.0.0.0', port=args.port, threads=server_threads, connection_limit=200, channel_timeout=30)
+    else:
+        app.run(host='0.0.0.0', port=args.port, debug=False, threaded=True)
 
 
 if __name__ == '__main__':
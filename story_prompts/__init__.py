@@ -0,0 +1 @@
+"""Story seed prompts, one module per genre (loaded on demand by config.STORY_PROMPTS)"""
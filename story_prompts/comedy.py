@@ -0,0 +1,24 @@
+"""Comedy story seed prompts"""
+
+PROMPTS = (
+    "A supermarket self-checkout declares 'unexpected item'—it’s their dignity",
+    "Roommates attempt a 'no-spend week' and accidentally throw a banquet",
+    "A new smart doorbell keeps misidentifying visitors with wildly flattering titles",
+    "Someone joins a gym for the free smoothie samples and becomes a legend",
+    "A couple’s home renovation reveal is photobombed by their chaotic pet… repeatedly",
+    "Two neighbors escalate a 'quiet hours' war via increasingly polite notes",
+    "A newbie barista invents drink names to avoid admitting they forgot the menu",
+    "An online return window closes in one hour—cue a heist of bubble wrap",
+    "A fake-it-till-you-make-it dog trainer meets a dog who can actually talk (or… can it?)",
+    "A first date speed-runs every small-talk topic like a game show",
+    "A family group chat goes autocorrect-feral during a surprise party setup",
+    "A self-proclaimed minimalist keeps 'accidentally' winning raffles",
+    "A wedding seating chart becomes a live-action puzzle with wrong name cards",
+    "Two rivals sabotage each other’s cooking livestreams—until they go viral together",
+    "A fashion try-on haul summons an intervention from past outfits",
+    "A pet influencer’s owner realizes the pet is the better negotiator",
+    "A ride-share mixes up 'opera house' and 'open house'—they perform anyway",
+    "A DIY shelf installation becomes a thriller when the level app freezes at 99%",
+    "Someone pretends to be fluent in 'wine talk' at a tasting and invents new fruit",
+    "A lost & found box at a beach wedding keeps returning the wrong sunglasses"
+)
@@ -0,0 +1,24 @@
+"""Drama story seed prompts"""
+
+PROMPTS = (
+    "A last voicemail before a flight reveals the truth no one wanted to hear",
+    "During a storm blackout, a neighbor returns a borrowed item—and an old grudge",
+    "A bridal fitting turns when the tailor recognizes the ring from a past scandal",
+    "A roadside diner receipt exposes who really paid for the family’s secrets",
+    "Two siblings divide a storage unit and uncover why one of them left town",
+    "A landlord finds an unsent letter in the vent and must decide who gets to read it",
+    "The final rehearsal before opening night—someone switches the monologue",
+    "A nurse’s end-of-shift handoff includes a name they swore they’d never say again",
+    "An inheritance stipulates a single shared dinner with no phones—until one pings",
+    "A realtor shows a house to a buyer who grew up there and remembers it differently",
+    "A rideshare home from the hospital forces a couple to define 'family' now",
+    "A courtroom hallway apology collides with a journalist’s live stream",
+    "The morning a parent moves out, the family group chat explodes with truths",
+    "A bouquet delivered to the wrong apartment mends the right relationship",
+    "At a school talent show, a parent realizes the act is about them",
+    "A graduation cap message changes where everyone sits afterwards",
+    "A missed train strands two exes with one suitcase of their shared past",
+    "A food truck tip jar holds a wedding ring—whose is it?",
+    "A voicemail transcription autocorrects one word that rewrites a life",
+    "A hospital vending machine eats a dollar and spits out a decision"
+)
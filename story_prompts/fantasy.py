@@ -0,0 +1,24 @@
+"""Fantasy story seed prompts"""
+
+PROMPTS = (
+    "A key cut at the hardware store opens a door in the sky at dusk",
+    "Street murals step down to guide lost travelers after rain",
+    "A neighborhood stray cat delivers quests via bottlecap tokens",
+    "A convenience store freezer stocks seasons you can purchase",
+    "A busker’s song summons the same flock of paper cranes every day",
+    "A midnight bookstore sells words that grant one courage each",
+    "A rooftop garden grows constellations instead of flowers",
+    "A city fountain trades wishes for memories you can spare",
+    "Elevator buttons labeled with feelings go to matching floors",
+    "A tailor sews pockets that hold brief moments of yesterday",
+    "A lighthouse rotates to point at people who need to meet",
+    "A thundercloud sets down its silver lining to be mended",
+    "A library card lets you borrow an hour from any century",
+    "Sidewalk chalk drawings come alive until the first car passes",
+    "An antique mirror shows the person you’ll need tomorrow",
+    "A ferry crosses a river and a year",
+    "A night market sells bottled moonlight with a warning label",
+    "A lost glove returns with a map stitched inside",
+    "A train whistle trades secrets for safe passage",
+    "A doorbell rings only for those who have a quest pending"
+)
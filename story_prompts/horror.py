@@ -0,0 +1,24 @@
+"""Horror story seed prompts"""
+
+PROMPTS = (
+    "An empty mall plays soft music from a store that never opened",
+    "Ceiling tiles breathe when the fluorescent lights flicker",
+    "A birthday candle won’t blow out; the wax spells a name in drips",
+    "An overnight office printer produces photos of the staff… sleeping at home",
+    "A motel ice machine dispenses keys to rooms that don’t exist",
+    "A storm siren wails only inside the house",
+    "A VHS tape labeled 'Do Not Rewind' keeps starting mid-scream",
+    "A baby monitor picks up lullabies sung in a language from your childhood home",
+    "Footprints lead into the attic; handprints lead out",
+    "A thrifted painting adds a new figure every night",
+    "Elevator mirrors show passengers carrying things they aren’t holding",
+    "The town bulletin board posts an obituary before anyone dies",
+    "A coastal fog bell rings inland at your bedroom door",
+    "A door peephole reveals a hallway from 1978",
+    "An unplugged landline rings with a busy signal on the other end",
+    "Street names rearrange themselves after midnight to spell a warning",
+    "A church sign updates itself with confessions",
+    "Every photo on your phone has a second moon",
+    "A playground swing moves against the wind and stops when you look away",
+    "Your shadow waves back two beats late"
+)
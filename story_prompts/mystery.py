@@ -0,0 +1,24 @@
+"""Mystery story seed prompts"""
+
+PROMPTS = (
+    "A laundromat dryer returns a stranger’s jacket with a locked pocket",
+    "Every Tuesday, the same bench receives a single white chess pawn",
+    "A cafe tab prints an extra line item: 'time owed'",
+    "A ferry manifest lists one more passenger than seats",
+    "A burned-out streetlamp hides a message when photographed",
+    "A library book’s due date stamps form a phone number",
+    "An apartment buzzer rings at 3:03 a.m. with no one downstairs",
+    "A city map graffiti adds a new alley that solves cold cases",
+    "A recurring billboard displays yesterday’s news until you look away",
+    "A trail of grocery receipts traces a route to a missing person",
+    "A hotel Do Not Disturb sign hangs on a door of a room under renovation",
+    "A box of keys appears on a stoop; one opens more than a lock",
+    "A mural’s paint chips expose coordinates layer by layer",
+    "An old voicemail skips a digit only a few will notice",
+    "A pawn shop tag lists a buyer’s name before the sale",
+    "A bus route detours through a neighborhood that vanished years ago",
+    "A torn concert ticket matches a song clue in a crossword",
+    "An online auction bids from an account belonging to the dead",
+    "A coded recipe reveals a map when baked and folded",
+    "A stack of Polaroids ages in reverse across the pile"
+)
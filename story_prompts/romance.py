@@ -0,0 +1,24 @@
+"""Romance story seed prompts"""
+
+PROMPTS = (
+    "Two strangers keep swapping umbrellas in the same lobby during summer storms",
+    "A florist includes mystery notes meant for someone with the same first name",
+    "A pastry shop’s 'pay it forward' chain reconnects study-abroad sweethearts",
+    "A citywide power outage strands two neighbors on the stairwell",
+    "Train seatmates co-write a breakup text and never exchange numbers",
+    "A museum audio guide misroutes two visitors into each other’s tours",
+    "A dog-walking route creates a perfect heart on the GPS—by accident… or not",
+    "A janitor and a night-shift chef exchange recipes via whiteboard doodles",
+    "A shared laundry card sparks weekly rendezvous and detergent diplomacy",
+    "A borrowed library book returns with annotations that flirt back",
+    "A wedding plus-one assignment pairs sworn introverts at the kids’ table",
+    "Airport strangers trade playlists before boarding separate flights",
+    "Two commuters race the same crosswalk countdown every morning",
+    "A bar’s karaoke rotation keeps pairing the same duet",
+    "An apartment mailroom misdelivers postcards from one street over",
+    "A park chess clock ticks down to a question neither can stall",
+    "A moving sale leaves one lamp glowing in two windows",
+    "A rotating pop-up cafe opens on alternating corners where they meet",
+    "A sunset bus detour reroutes two routines into a ritual",
+    "A recipe card passed down is missing the last line—until today"
+)
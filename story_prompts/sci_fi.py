@@ -0,0 +1,24 @@
+"""Sci-Fi story seed prompts"""
+
+PROMPTS = (
+    "A coastal town wakes to tides that run backwards until noon",
+    "A commuter discovers the same sunrise repeating on odd-numbered days",
+    "A new tattoo maps a city that doesn’t exist—yet the bus routes do",
+    "Gravity lightens by one percent each hour until the choice becomes jump or stay",
+    "A mountain road appears flat to the eye but bends time for its drivers",
+    "Photographs taken today develop as images from ten years ahead",
+    "A lighthouse beams coordinates for a place under the desert",
+    "A storm front freezes mid-air over a single house for 24 hours",
+    "A farmer’s field yields objects from a mission that hasn’t launched",
+    "Shadows detach at noon and walk a different route home",
+    "A train’s windows show cities no one recognizes—until they step off",
+    "A constellation rearranges itself to spell one surname each night",
+    "A wristwatch skips 17 minutes daily and saves a life each time",
+    "Two strangers carry matching scars from an unshared memory",
+    "Rain falls in precise circles that avoid one person entirely",
+    "A street mural updates itself with tomorrow’s traffic patterns",
+    "The moon rises twice, and only one casts tides",
+    "A canyon echoes words that were never spoken aloud",
+    "A child’s kite pulls toward an invisible mountain",
+    "A library basement door leads to the same room on another Tuesday"
+)
@@ -0,0 +1,24 @@
+"""Thriller story seed prompts"""
+
+PROMPTS = (
+    "A delivery arrives with a photo of the recipient opening it—taken seconds ago",
+    "A hotel keycard opens two different rooms in the same hallway",
+    "Someone finds their own house listed as 'abandoned' on a property app",
+    "A rideshare app routes every trip to the same cul-de-sac after midnight",
+    "Anonymous push notifications know what’s in their pockets",
+    "Security cam footage reveals a visitor who never looks at the camera",
+    "Every mirror in the apartment is off by one second",
+    "A subway map shows an extra stop that only appears when they’re alone",
+    "A voicemail plays in reverse and gives directions that work",
+    "The new coworker always arrives wet—yet it never rains where they live",
+    "A neighbor’s doorbell camera shows the protagonist leaving… before they arrive",
+    "A thrifted jacket has a metro card with one ride left and a warning",
+    "Streetlights flicker in a pattern that matches their old heartbeat monitor",
+    "A parking garage gate doesn’t register exits—only entries",
+    "Someone receives a 'thank you for your help' gift from an unsolved case",
+    "A ten-digit number appears everywhere; dialing it makes the room colder",
+    "An elevator stops on a labeled 'R' floor that isn’t on the panel",
+    "A child’s drawing predicts tomorrow’s headlines in the corner doodles",
+    "A dashcam loop omits exactly three seconds—every time",
+    "A stranger returns a wallet that was never lost and knows the PIN"
+)